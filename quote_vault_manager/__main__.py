@@ -3,6 +3,7 @@ import sys
 from quote_vault_manager.config import load_config, ConfigError
 from quote_vault_manager.services.sync import sync_vaults
 from quote_vault_manager.services.logger import Logger
+from quote_vault_manager.services.parse_cache import ParseCache
 from . import VERSION
 
 def main():
@@ -13,11 +14,14 @@ def main():
 Examples:
   python -m quote_vault_manager --config config.yaml --dry-run
   python -m quote_vault_manager --config config.yaml
+  python -m quote_vault_manager --config config.yaml --clean-cache
         """
     )
     parser.add_argument("--config", required=True, help="Path to YAML config file")
     parser.add_argument("--dry-run", action="store_true", 
                        help="Run in dry-run mode (show what would be done without making changes)")
+    parser.add_argument("--clean-cache", action="store_true",
+                       help="Discard the parse cache before syncing")
     args = parser.parse_args()
     
     try:
@@ -25,7 +29,11 @@ Examples:
         config = load_config(args.config)
         
         # Setup logger singleton
-        logger = Logger.get_instance(config.get('std_log_path', ''), config.get('err_log_path', ''))
+        logger = Logger.get_instance(config.get('std_log_path', ''), config.get('err_log_path', ''), background=True)
+        
+        if args.clean_cache:
+            ParseCache.get_instance().clear(config['destination_vault_path'])
+            print("🧹 Cleared parse cache")
         
         # Run sync
         if args.dry_run:
@@ -52,9 +60,9 @@ Examples:
         print(f"  Quotes unwrapped: {results.get('total_quotes_unwrapped', 0)}")
         
         if results['errors']:
-            print(f"\n❌ Errors encountered:")
+            # Emit the whole error report in one write rather than one per error
+            print(f"\n❌ Errors encountered:\n" + "\n".join(f"  - {error}" for error in results['errors']))
             for error in results['errors']:
-                print(f"  - {error}")
                 logger.log_error(error, "Sync Error")
             sys.exit(1)
         else:
@@ -1,5 +1,6 @@
 import yaml
 import warnings
+from quote_vault_manager.file_utils import YamlSafeLoader
 
 REQUIRED_KEYS = [
     "source_vault_path",
@@ -14,13 +15,16 @@ CRITICAL_KEYS = [
     "source_path",
 ]
 
+_REQUIRED = frozenset(REQUIRED_KEYS)
+_CRITICAL = frozenset(CRITICAL_KEYS)
+
 class ConfigError(Exception):
     pass
 
 def load_config(path):
     try:
         with open(path, "r") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YamlSafeLoader)
     except Exception as e:
         raise ConfigError(f"Failed to load config file: {e}")
 
@@ -28,17 +32,16 @@ def load_config(path):
         raise ConfigError("Config file must be a YAML dictionary.")
 
     # Check for missing required keys
-    missing = [k for k in REQUIRED_KEYS if k not in config]
+    missing = _REQUIRED - config.keys()
     if missing:
-        raise ConfigError(f"Missing required config keys: {', '.join(missing)}")
+        missing_in_order = [k for k in REQUIRED_KEYS if k in missing]
+        raise ConfigError(f"Missing required config keys: {', '.join(missing_in_order)}")
 
     # Check for unexpected keys and warn
-    all_keys = set(config.keys())
-    expected_keys = set(REQUIRED_KEYS)
-    unexpected_keys = all_keys - expected_keys
+    unexpected_keys = config.keys() - _REQUIRED
     
     for key in unexpected_keys:
-        if key in CRITICAL_KEYS:
+        if key in _CRITICAL:
             warnings.warn(f"Critical config key '{key}' found in config file. This may cause issues.", UserWarning)
         else:
             warnings.warn(f"Unexpected config key '{key}' found in config file. This key will be ignored.", UserWarning)
@@ -3,7 +3,18 @@ File utility functions for the quote vault manager.
 """
 
 import os
-from typing import List
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Iterable, Optional, Tuple
+
+try:
+    # libyaml-backed loader is roughly 10x faster than the pure-Python one
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader  # type: ignore
+
+from quote_vault_manager.services.parse_cache import ParseCache
 
 
 def has_sync_quotes_flag(file_path: str) -> bool:
@@ -11,10 +22,109 @@ def has_sync_quotes_flag(file_path: str) -> bool:
     Checks if a markdown file has sync_quotes: true in its frontmatter.
     Returns True if the flag is set, False otherwise.
     """
-    frontmatter, _ = split_frontmatter_from_file(file_path)
-    if frontmatter:
-        return 'sync_quotes: true' in frontmatter
-    return False
+    frontmatter = get_cached_frontmatter(file_path)
+    return frontmatter is not None and b'sync_quotes: true' in frontmatter
+
+
+# path -> ((mtime_ns, size), raw frontmatter bytes or None); reused while the file is unchanged.
+# Cleared at the start of each sync run and capped so long-lived processes don't grow it forever.
+_FRONTMATTER_CACHE: Dict[str, Tuple[Tuple[int, int], Optional[bytes]]] = {}
+_FRONTMATTER_LOCK = threading.Lock()
+FRONTMATTER_CACHE_SIZE = 8192
+
+
+def clear_frontmatter_cache() -> None:
+    """Forget all remembered frontmatter, e.g. at the start of a sync run."""
+    with _FRONTMATTER_LOCK:
+        _FRONTMATTER_CACHE.clear()
+
+
+def get_cached_frontmatter(path: str) -> Optional[bytes]:
+    """
+    Like read_frontmatter_bytes, but remembers the result per path so repeated flag checks
+    during a sync cost a stat instead of a read. A changed mtime or size invalidates it.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    with _FRONTMATTER_LOCK:
+        cached = _FRONTMATTER_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    frontmatter = read_frontmatter_bytes(path)
+    # A file modified this recently may change again within the same mtime tick at the
+    # same size, so it is not remembered (the same guard ParseCache uses)
+    racy = time.time_ns() - st.st_mtime_ns < ParseCache.RACY_WINDOW_NS
+    with _FRONTMATTER_LOCK:
+        if racy:
+            _FRONTMATTER_CACHE.pop(path, None)
+            return frontmatter
+        if path not in _FRONTMATTER_CACHE and len(_FRONTMATTER_CACHE) >= FRONTMATTER_CACHE_SIZE:
+            # Evict the oldest entry; dicts keep insertion order
+            del _FRONTMATTER_CACHE[next(iter(_FRONTMATTER_CACHE))]
+        _FRONTMATTER_CACHE[path] = (key, frontmatter)
+    return frontmatter
+
+
+# Frontmatter normally fits well within this many leading bytes
+FRONTMATTER_HEAD_SIZE = 4096
+
+
+def read_file_head(path: str, size: int = FRONTMATTER_HEAD_SIZE) -> bytes:
+    """Reads up to size leading bytes of a file with a single unbuffered read."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def read_frontmatter_bytes(path: str) -> Optional[bytes]:
+    """
+    Returns the raw bytes between the opening and closing '---' of a file's frontmatter,
+    or None if the file has no frontmatter or can't be read. Only the head of the file is
+    read unless the frontmatter runs past it.
+    """
+    try:
+        data = read_file_head(path)
+        if not data.startswith(b'---'):
+            return None
+        end = data.find(b'---', 3)
+        if end == -1 and len(data) == FRONTMATTER_HEAD_SIZE:
+            with open(path, 'rb') as f:
+                data = f.read()
+            end = data.find(b'---', 3)
+    except OSError:
+        return None
+    if end == -1:
+        return None
+    return data[3:end]
+
+
+# Directories the tool writes inside the destination vault; never treated as vault content
+VAULT_INTERNAL_DIRS = frozenset({'.backup', '.qvm-cache'})
+
+# Tool directories that never hold notes; hidden directories (.obsidian, .git, .trash)
+# are skipped as well, as Obsidian itself does
+IGNORED_DIRS = frozenset({'node_modules', '__pycache__'})
+
+
+def _is_ignored_dir(name: str) -> bool:
+    """Return True for directory names whose subtree is never walked."""
+    return name.startswith('.') or name in IGNORED_DIRS
+
+
+def filter_sync_quote_files(file_paths: List[str]) -> List[str]:
+    """
+    Returns the subset of file_paths that have sync_quotes: true, preserving order.
+    """
+    return [path for path in file_paths if has_sync_quotes_flag(path)]
+
+
+# Vault roots with more entries than this are walked with concurrent scandir calls
+PARALLEL_WALK_THRESHOLD = 64
 
 
 def get_markdown_files(directory: str) -> List[str]:
@@ -22,19 +132,96 @@ def get_markdown_files(directory: str) -> List[str]:
     Recursively finds all markdown files in the given directory.
     Returns a list of file paths.
     """
-    markdown_files = []
-    
-    if not os.path.exists(directory):
-        return markdown_files
-    
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.md'):
-                markdown_files.append(os.path.join(root, file))
-    
+    # The root listing both sizes the vault and seeds the walk, so the root is read only once
+    root_listing = _scan_directory(directory)
+    _, files, subdirs = root_listing
+    if len(files) + len(subdirs) > PARALLEL_WALK_THRESHOLD:
+        return get_markdown_files_parallel(directory, root_listing=root_listing)
+    markdown_files = list(files)
+    for subdir in subdirs:
+        markdown_files.extend(entry.path for entry in iter_markdown_files(subdir))
     return markdown_files
 
 
+def get_markdown_files_parallel(directory: str, threads: int = 32,
+                                root_listing: Optional[Tuple[str, List[str], List[str]]] = None) -> List[str]:
+    """
+    Recursively finds all markdown files, scanning directories on a thread pool so many
+    scandir calls are in flight at once (helps on network drives and cold caches).
+    root_listing is an already-scanned _scan_directory(directory) result to start from.
+    Returns paths in the same order as get_markdown_files.
+    """
+    listings: Dict[str, Tuple[List[str], List[str]]] = {}
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        if root_listing is None:
+            pending = {executor.submit(_scan_directory, directory)}
+        else:
+            _, files, subdirs = root_listing
+            listings[directory] = (files, subdirs)
+            pending = {executor.submit(_scan_directory, subdir) for subdir in subdirs}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, files, subdirs = future.result()
+                listings[path] = (files, subdirs)
+                pending.update(executor.submit(_scan_directory, subdir) for subdir in subdirs)
+    markdown_files: List[str] = []
+    stack = [directory]
+    while stack:
+        files, subdirs = listings[stack.pop()]
+        markdown_files.extend(files)
+        stack.extend(reversed(subdirs))
+    return markdown_files
+
+
+def _scan_directory(path: str) -> Tuple[str, List[str], List[str]]:
+    """
+    Lists one directory, returning (path, markdown file paths, subdirectory paths).
+    scandir reads entries in large batches (getdents64 / FindFirstFileEx) and the
+    is_dir/is_file checks use the returned entry type, so no per-entry stat is made.
+    """
+    files: List[str] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not _is_ignored_dir(entry.name):
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.md') and entry.is_file():
+                    files.append(entry.path)
+    except OSError:
+        pass
+    return path, files, subdirs
+
+
+def iter_markdown_files(directory: str, skip_dirs: Iterable[str] = ()) -> Iterator[os.DirEntry]:
+    """
+    Recursively yields a DirEntry for every markdown file under directory.
+    Directories whose name is in skip_dirs, hidden directories and IGNORED_DIRS
+    are not descended into.
+    Uses os.scandir so file/dir checks reuse the cached dirent type instead of stat-ing.
+    """
+    skip = set(skip_dirs)
+    stack = [directory]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # Unreadable or vanished directory; skip it like os.walk does
+            continue
+        subdirs = []
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip and not _is_ignored_dir(entry.name):
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.md') and entry.is_file():
+                    yield entry
+        # Reversed so subdirectories are visited in listing order, as with os.walk
+        stack.extend(reversed(subdirs))
+
+
 def get_book_title_from_path(file_path: str) -> str:
     """
     Extracts the book title from a file path.
@@ -56,12 +243,13 @@ def split_frontmatter(content: str) -> tuple:
     If not, returns (None, content).
     """
     if content.startswith('---'):
-        parts = content.split('---', 2)
-        if len(parts) >= 3:
-            frontmatter = parts[1].strip()
-            body = parts[2].lstrip('\n')
+        # Same result as content.split('---', 2) without building the parts list
+        end = content.find('---', 3)
+        if end != -1:
+            frontmatter = content[3:end].strip()
+            body = content[end + 3:].lstrip('\n')
             return frontmatter, body
-    return None, content 
+    return None, content
 
 
 def split_frontmatter_from_file(path: str) -> tuple:
@@ -1,17 +1,54 @@
+import os
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Protocol
+
+class SaveableFile(Protocol):
+    """What BaseVault needs from the files it holds."""
+    path: Optional[str]
+
+    def save(self, path: str) -> Any:
+        ...
 
 class BaseVault(ABC):
+    # Batches smaller than this are loaded/saved serially; thread start-up would dominate
+    PARALLEL_IO_THRESHOLD = 16
+    MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
     def __init__(self, directory: str, vault_name: str = ""):
         self.directory = directory
         self.vault_name = vault_name
-        self.files: List = self._load_files()
+        self._files: Optional[List[SaveableFile]] = None
+
+    @property
+    def files(self) -> List[SaveableFile]:
+        """Files in the vault, parsed from disk on first access rather than at construction."""
+        if self._files is None:
+            self._files = self._load_files()
+        return self._files
+
+    @files.setter
+    def files(self, files: List[SaveableFile]):
+        self._files = files
 
     @abstractmethod
-    def _load_files(self) -> List:
+    def _load_files(self) -> List[SaveableFile]:
         pass
 
     def save_all(self):
-        for file in self.files:
-            if hasattr(file, 'save') and file.path:
-                file.save(file.path) 
\ No newline at end of file
+        self._save_files([file for file in self.files if file.path])
+
+    def _save_files(self, files: List[SaveableFile]):
+        """Save each file to its own path; files are independent, so large batches use a thread pool."""
+        self._map_io(lambda file: file.save(file.path), files)
+
+    def _map_io(self, fn: Callable[[Any], Any], items: List) -> List:
+        """
+        Returns [fn(item) for item in items], running fn on a thread pool when there are
+        enough items for overlapping file I/O to pay off. Results keep the input order and
+        the first exception is re-raised, as with the plain loop.
+        """
+        if not items or len(items) < self.PARALLEL_IO_THRESHOLD:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_IO_WORKERS, len(items))) as executor:
+            return list(executor.map(fn, items))
@@ -1,9 +1,130 @@
+import copy
+import functools
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from urllib.parse import quote as url_quote, unquote
+import yaml
 from .quote import Quote
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
+from quote_vault_manager import VERSION
+from quote_vault_manager.file_utils import (
+    YamlSafeLoader,
+    get_cached_frontmatter,
+    split_frontmatter_from_file,
+)
+from quote_vault_manager.services.parse_cache import ParseCache
+from quote_vault_manager.transformations.v0_2_add_random_note_link import RANDOM_NOTE_LINK
 
 if TYPE_CHECKING:
     from .destination_vault import DestinationVault
 
+logger = logging.getLogger(__name__)
+
+# Block ID part of "Book - QuoteNNN - first words.md": text after the first ' - Quote' up to the next ' - '
+_BLOCK_ID_FILENAME_RE = re.compile(r' - Quote(.*?)(?: - |\Z)', re.DOTALL)
+# Encoded source file path in the "**Source:**" Obsidian URI
+_OBSIDIAN_URI_RE = re.compile(r'\(obsidian://open\?vault=[^&]+&file=([^#)]+)')
+# Runs of dashes left over after replacing path separators in filenames
+_DASH_COLLAPSE_RE = re.compile(r'-+')
+# Process umask, read once at import: mkstemp creates files 0600, plain open() honours the umask
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+# A word YAML reads as a plain string: starts with a letter, no spaces, quotes or other YAML syntax
+_PLAIN_WORD_RE = re.compile(r'[A-Za-z][A-Za-z0-9._-]*')
+# Plain words YAML 1.1 resolves to booleans or null instead of strings
+_YAML_SPECIAL_WORDS = frozenset({'y', 'yes', 'n', 'no', 'true', 'false', 'on', 'off', 'null'})
+# One "key: value" frontmatter line; the value is a bare word or a double-quoted string
+# of printable characters without escapes
+_SIMPLE_FRONTMATTER_LINE_RE = re.compile(
+    r'([A-Za-z][A-Za-z0-9._-]*): '
+    r'(?:"([\x20\x21\x23-\x5b\x5d-\x7e\xa0-\ud7ff\ue000-\ufffd]*)"|([A-Za-z][A-Za-z0-9._-]*))'
+)
+
+
+def _is_plain_word(value: str) -> bool:
+    return _PLAIN_WORD_RE.fullmatch(value) is not None and value.lower() not in _YAML_SPECIAL_WORDS
+
+
+def _parse_simple_frontmatter(frontmatter: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the flat frontmatter this tool writes (true/false flags and a version string)
+    without PyYAML. Returns None for anything else, so the caller can fall back to YAML.
+    """
+    result: Dict[str, Any] = {}
+    for line in frontmatter.split('\n'):
+        match = _SIMPLE_FRONTMATTER_LINE_RE.fullmatch(line)
+        if match is None:
+            return None
+        key, quoted, word = match.groups()
+        if key.lower() in _YAML_SPECIAL_WORDS:
+            return None
+        if quoted is not None:
+            result[key] = quoted
+        elif word == 'true':
+            result[key] = True
+        elif word == 'false':
+            result[key] = False
+        elif word.lower() in _YAML_SPECIAL_WORDS:
+            return None
+        else:
+            result[key] = word
+    return result
+
+
+def _dump_simple_frontmatter(frontmatter_dict: Dict[str, Any]) -> Optional[str]:
+    """
+    Render a frontmatter dict of booleans and plain-word strings exactly as
+    yaml.safe_dump(sort_keys=False).strip() would. Returns None for anything else.
+    """
+    lines = []
+    for key, value in frontmatter_dict.items():
+        if not isinstance(key, str) or not _is_plain_word(key):
+            return None
+        if value is True:
+            lines.append(f"{key}: true")
+        elif value is False:
+            lines.append(f"{key}: false")
+        elif isinstance(value, str) and _is_plain_word(value):
+            lines.append(f"{key}: {value}")
+        else:
+            return None
+    return '\n'.join(lines)
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_source_file(source_file: str, vault_root: str) -> str:
+    """URI-encoded, vault-relative source path for Obsidian links; every quote of a book shares it."""
+    if source_file.endswith('.md'):
+        source_file = source_file[:-3]
+    if vault_root:
+        rel_path = os.path.relpath(source_file, vault_root)
+    else:
+        rel_path = source_file
+    return url_quote(rel_path.replace(os.sep, '/'))
+
+
+@functools.lru_cache(maxsize=4096)
+def _source_link_text(source_file: str) -> str:
+    """Link text for a source file: its filename without the .md extension."""
+    return os.path.basename(source_file).replace('.md', '')
+
+
+@functools.lru_cache(maxsize=4096)
+def _load_frontmatter(frontmatter: str) -> Any:
+    """Parse a frontmatter string; identical strings (the common case across a vault) are parsed once."""
+    simple = _parse_simple_frontmatter(frontmatter)
+    if simple is not None:
+        return simple
+    try:
+        return yaml.load(frontmatter, Loader=YamlSafeLoader) or {}
+    except Exception:
+        return {}
+
 class DestinationFile:
     """
     Represents a destination file with frontmatter and a single quote.
@@ -22,9 +143,15 @@ class DestinationFile:
 
     [Random Note](obsidian://advanced-uri?vault=Notes&commandid=random-note-open)
     """
-    def __init__(self, frontmatter: Dict[str, Any], quote: Quote, path: Optional[str] = None, *, marked_for_deletion: bool = False, needs_update: bool = False, is_new: bool = False, destination_vault: Optional['DestinationVault'] = None):
+    # Vaults hold one instance per quote file; slots keep them small
+    __slots__ = (
+        'frontmatter', 'quote', 'path', 'marked_for_deletion', 'needs_update', 'is_new',
+        'destination_vault', 'filename', 'source_path', '_loaded_hash', '_body_tail',
+    )
+
+    def __init__(self, frontmatter: Dict[str, Any], quote: Quote, path: Optional[str] = None, *, marked_for_deletion: bool = False, needs_update: bool = False, is_new: bool = False, destination_vault: Optional['DestinationVault'] = None, source_path: Optional[str] = None):
         """
-        Initialize a DestinationFile.
+        Initialize a DestinationFile. Never reads the file; use from_file to load one from disk.
         Args:
             frontmatter: Frontmatter dict.
             quote: Quote object.
@@ -33,6 +160,7 @@ class DestinationFile:
             needs_update: If True, file will be updated on commit.
             is_new: If True, file is new and will be created on commit.
             destination_vault: Reference to the DestinationVault this file belongs to.
+            source_path: Path of the source file the quote came from, if known.
         """
         self.frontmatter = frontmatter
         self.quote = quote
@@ -41,15 +169,12 @@ class DestinationFile:
         self.needs_update = needs_update
         self.is_new = is_new
         self.destination_vault = destination_vault
-        import os
+        # SHA-256 of the bytes last read from or written to self.path, if known
+        self._loaded_hash: Optional[bytes] = None
+        # Everything after the closing frontmatter '---' line, if known
+        self._body_tail: Optional[str] = None
         self.filename = os.path.basename(path) if path else None
-        self.source_path = None
-        if path:
-            try:
-                frontmatter_str, content = self.read_quote_file_content(path)
-                self.source_path = self.extract_source_path_from_content(content)
-            except Exception:
-                self.source_path = None
+        self.source_path = source_path
 
     def __repr__(self):
         return f"DestinationFile(frontmatter={self.frontmatter!r}, quote={self.quote!r}, path={self.path!r})"
@@ -67,32 +192,75 @@ class DestinationFile:
     @classmethod
     def from_file(cls, path: str, destination_vault: Optional['DestinationVault'] = None) -> 'DestinationFile':
         """Parses the file at path and returns a DestinationFile with frontmatter and quote."""
-        import os
-        frontmatter_str, content = cls.read_quote_file_content(path)
+        parsed, digest = ParseCache.get_instance().load_parsed_with_digest(path, 'destination', cls._parse_content)
+        return cls._from_parsed(path, parsed, digest, destination_vault)
+
+    @classmethod
+    def _from_parsed(cls, path: str, parsed: Tuple[Optional[str], str, str, Optional[str]], digest: bytes, destination_vault: Optional['DestinationVault'] = None) -> 'DestinationFile':
+        """Builds a DestinationFile from the output of _parse_content for the file at path."""
+        frontmatter_str, quote_text, source_path, body_tail = parsed
+        # The parsed tuple is shared through ParseCache; the frontmatter dict is this file's own copy
         frontmatter = cls.frontmatter_str_to_dict(frontmatter_str) if frontmatter_str else {}
-        quote_text = cls.extract_quote_text_from_content(content)
-        filename = os.path.basename(path)
-        block_id = cls.extract_block_id_from_filename(filename)
-        quote = Quote(quote_text, block_id)
-        obj = cls(frontmatter, quote, path=path, marked_for_deletion=False, needs_update=False, is_new=False, destination_vault=destination_vault)
-        obj.filename = filename
-        obj.source_path = cls.extract_source_path_from_content(content)
+        quote = Quote(quote_text, None)
+        obj = cls(frontmatter, quote, path=path, marked_for_deletion=False, needs_update=False, is_new=False, destination_vault=destination_vault, source_path=source_path)
+        # The constructor has already taken the basename of path
+        quote.block_id = cls.extract_block_id_from_filename(obj.filename)
+        obj._loaded_hash = digest
+        obj._body_tail = body_tail
         return obj
 
+    @classmethod
+    def _parse_content(cls, file_content: str) -> Tuple[Optional[str], str, str, Optional[str]]:
+        """
+        Parses raw file content into an immutable (frontmatter string, quote text, source path,
+        body tail) tuple. The frontmatter stays a string; _from_parsed turns it into a dict.
+        """
+        # Locate the closing '---' once and derive frontmatter, body and body tail from it
+        # (same results as split_frontmatter and _split_body_tail)
+        frontmatter_str, content, body_tail = None, file_content, None
+        if file_content.startswith('---'):
+            end = file_content.find('---', 3)
+            if end != -1:
+                frontmatter_str = file_content[3:end].strip()
+                tail = file_content[end + 3:]
+                body_tail = tail[1:] if tail.startswith('\n') else tail
+                content = tail.lstrip('\n')
+        return (
+            frontmatter_str,
+            cls.extract_quote_text_from_content(content),
+            cls.extract_source_path_from_content(content),
+            body_tail,
+        )
+
+    @staticmethod
+    def _split_body_tail(file_content: str) -> Optional[str]:
+        """Return everything after the closing frontmatter '---' line, or None without frontmatter."""
+        if file_content.startswith('---'):
+            end = file_content.find('---', 3)
+            if end != -1:
+                tail = file_content[end + 3:]
+                return tail[1:] if tail.startswith('\n') else tail
+        return None
+
     def save(self, path: str):
         """Saves the current frontmatter and quote to the file at the given path."""
         if not path:
             raise ValueError("Path must not be None when saving a DestinationFile.")
-        import os
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        directory = os.path.dirname(path)
+        # During a vault save pass a book's quotes share one makedirs call
+        known_dirs = self.destination_vault._known_dirs if self.destination_vault else None
+        if known_dirs is None or directory not in known_dirs:
+            os.makedirs(directory, exist_ok=True)
+            if known_dirs is not None:
+                known_dirs.add(directory)
         
         # Use the existing template to create proper content with source links
         frontmatter_str = self.frontmatter_dict_to_str(self.frontmatter)
         quote_text = self.quote.text or ''
         block_id = self.quote.block_id or ''
         
-        print(f"  DestinationFile.save: frontmatter={self.frontmatter}")
-        print(f"  DestinationFile.save: frontmatter_str={frontmatter_str}")
+        logger.debug("DestinationFile.save: frontmatter=%s", self.frontmatter)
+        logger.debug("DestinationFile.save: frontmatter_str=%s", frontmatter_str)
         
         # Use source_path if available, otherwise extract from filename
         source_file = self.source_path or ''
@@ -114,42 +282,73 @@ class DestinationFile:
             quote_text, source_file, block_id, frontmatter_str, vault_name, vault_root
         )
         
-        print(f"  DestinationFile.save: Writing content to {path}")
-        print(f"  DestinationFile.save: Content starts with: {content[:200]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DestinationFile.save: Writing content to %s", path)
+            logger.debug("DestinationFile.save: Content starts with: %s...", content[:200])
         
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Most files are already in sync on steady-state runs; skip rewriting content
+        # whose hash matches the bytes we loaded (or last wrote) at this path
+        digest = hashlib.sha256(content.encode('utf-8')).digest()
+        if path != self.path or digest != self._loaded_hash:
+            self._write_atomic(path, content)
+        if path == self.path:
+            self._loaded_hash = digest
+            self._body_tail = self._split_body_tail(content)
         self.is_new = False
         self.needs_update = False
 
+    @staticmethod
+    def _write_atomic(path: str, content: str):
+        """Write content to a temp file next to path and rename it over path, so a crash never leaves a partial file."""
+        # A unique temp name per call, so threads saving the same path never share one
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            with open(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
     @staticmethod
     def delete(path: str):
         """Deletes the destination file at the given path."""
-        import os
         if path and os.path.exists(path):
             os.remove(path)
+            ParseCache.get_instance().forget(path)
 
     @staticmethod
     def is_edited_quote_file(file_path: str) -> bool:
         """Return True if file is a markdown file with edited: true in frontmatter."""
         if not isinstance(file_path, str) or not file_path.endswith('.md'):
             return False
-        frontmatter, _ = DestinationFile.read_quote_file_content(file_path)
+        raw_frontmatter = get_cached_frontmatter(file_path)
+        if not raw_frontmatter:
+            return False
+        # Byte-level shortcut: without an 'edited' key there is nothing to decode or parse
+        if b'edited' not in raw_frontmatter:
+            return False
+        try:
+            frontmatter = raw_frontmatter.decode('utf-8').strip()
+        except UnicodeDecodeError:
+            return False
         if not frontmatter:
             return False
-        fm = DestinationFile.frontmatter_str_to_dict(frontmatter)
-        return fm.get('edited') is True
+        # Read-only lookup: use the memoized parse directly instead of a defensive copy
+        fm = _load_frontmatter(frontmatter)
+        return isinstance(fm, dict) and fm.get('edited') is True
 
     @staticmethod
     def extract_source_path_from_content(content: str) -> str:
         """Extract the source file path from the Obsidian URI in the quote file content."""
-        import re
-        from urllib.parse import unquote
         # Look for a line like: **Source:** [Book](obsidian://open?vault=Notes&file=...%23^QuoteNNN)
-        match = re.search(r'\(obsidian://open\?vault=[^&]+&file=([^%#)]+)', content)
+        match = _OBSIDIAN_URI_RE.search(content)
         if match:
-            encoded_path = match.group(1)
-            return unquote(encoded_path)
+            # Drop the encoded '#^QuoteNNN' anchor; any '%' before it belongs to the path
+            encoded_path, anchor, _ = match.group(1).rpartition('%23')
+            return unquote(encoded_path if anchor else match.group(1))
         return ""
 
     @staticmethod
@@ -165,19 +364,32 @@ class DestinationFile:
         new_quote_text = DestinationFile.extract_quote_text_from_content(content_str)
         return source_path, block_id, new_quote_text, fm
 
-    def update_frontmatter(self, updates: dict):
-        """Update the frontmatter in the destination file with the given updates."""
+    def update_frontmatter(self, updates: dict, flush: bool = True):
+        """
+        Update the frontmatter in the destination file with the given updates.
+        With flush=False the change is only applied in memory and the file is
+        marked for the next save/commit_changes, so several edits cost one write.
+        """
         if not self.path:
             raise ValueError("Path must not be None when updating frontmatter.")
         self.frontmatter.update(updates)
+        if not flush:
+            self.needs_update = True
+            return
         new_frontmatter = self.frontmatter_dict_to_str(self.frontmatter)
-        with open(self.path, 'r', encoding='utf-8') as f:
-            file_content = f.read()
-        parts = file_content.split('---', 2)
-        if len(parts) >= 3:
-            new_content = f"---\n{new_frontmatter}\n---\n{parts[2]}"
-            with open(self.path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+        # Reuse the body captured when the file was loaded instead of re-reading it
+        body_tail = self._body_tail
+        if body_tail is None:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                body_tail = self._split_body_tail(f.read())
+        if body_tail is not None:
+            new_content = f"---\n{new_frontmatter}\n---\n{body_tail}"
+            digest = hashlib.sha256(new_content.encode('utf-8')).digest()
+            # Updates that leave the file byte-for-byte as loaded are not written
+            if digest != self._loaded_hash:
+                self._write_atomic(self.path, new_content)
+                self._loaded_hash = digest
+            self._body_tail = body_tail
 
     @staticmethod
     def extract_book_title_from_filename(filename: str) -> str:
@@ -189,28 +401,15 @@ class DestinationFile:
     @staticmethod
     def extract_block_id_from_filename(filename: str) -> str:
         """Extract block ID from filename if possible."""
-        if ' - Quote' in filename:
-            parts = filename.split(' - Quote')
-            if len(parts) >= 2:
-                block_id_part = parts[1].split(' - ')[0]
-                return f"^Quote{block_id_part}"
+        match = _BLOCK_ID_FILENAME_RE.search(filename)
+        if match:
+            return f"^Quote{match.group(1)}"
         return ""
 
     @staticmethod
     def create_obsidian_uri(source_file: str, block_id: str, source_vault: str = "Notes", vault_root: str = "") -> str:
         """Creates an Obsidian URI in the correct format."""
-        from urllib.parse import quote
-        import os
-        if source_file.endswith('.md'):
-            source_file = source_file[:-3]
-        if vault_root:
-            rel_path = os.path.relpath(source_file, vault_root)
-        else:
-            rel_path = source_file
-        rel_path = rel_path.replace(os.sep, '/')
-        encoded_file = quote(rel_path)
-        encoded_block = quote(block_id)
-        return f"obsidian://open?vault={source_vault}&file={encoded_file}%23{encoded_block}"
+        return f"obsidian://open?vault={source_vault}&file={_encode_source_file(source_file, vault_root)}%23{url_quote(block_id)}"
 
     @staticmethod
     def _truncate_words_to_length(text: str, max_length: int = 30) -> str:
@@ -224,16 +423,16 @@ class DestinationFile:
 
     @staticmethod
     def _clean_filename_text(text: str) -> str:
-        import re
         cleaned = text.replace('\\', '-').replace('/', '-').replace(':', '-')
-        cleaned = re.sub(r'-+', '-', cleaned)
+        cleaned = _DASH_COLLAPSE_RE.sub('-', cleaned)
         return cleaned.strip('- ')
 
     @staticmethod
     def create_quote_filename(book_title: str, block_id: str, quote_text: str) -> str:
         clean_block_id = block_id.lstrip('^')
-        clean_quote_text = quote_text.strip()
-        words = clean_quote_text.split()[:5]
+        # Only the first five words are used, so stop splitting after them; split()
+        # already ignores leading and trailing whitespace
+        words = quote_text.split(None, 5)[:5]
         first_words = ' '.join(words)
         first_words = DestinationFile._truncate_words_to_length(first_words, 30)
         first_words = DestinationFile._clean_filename_text(first_words)
@@ -241,58 +440,55 @@ class DestinationFile:
 
     @staticmethod
     def _format_quote_text(quote_text: str) -> str:
-        quote_lines = quote_text.split('\n')
-        return '\n'.join(f'> {line}' for line in quote_lines)
+        # Prefix every line with '> ' in one pass, without an intermediate list of lines
+        return '> ' + quote_text.replace('\n', '\n> ')
 
     @staticmethod
     def _create_quote_content_template(quote_text: str, source_file: str, block_id: str, frontmatter: str, vault_name: str, vault_root: str) -> str:
         """Create quote content with the given frontmatter and quote text."""
-        from quote_vault_manager import VERSION
-        from quote_vault_manager.transformations.v0_2_add_random_note_link import RANDOM_NOTE_LINK
         uri = DestinationFile.create_obsidian_uri(source_file, block_id, vault_name, vault_root)
-        import os
-        link_text = os.path.basename(source_file).replace('.md', '')
+        link_text = _source_link_text(source_file)
         formatted_quote = DestinationFile._format_quote_text(quote_text)
         return f"""---\n{frontmatter}\n---\n\n{formatted_quote}\n\n**Source:** [{link_text}]({uri})\n\n{RANDOM_NOTE_LINK}\n"""
 
     @staticmethod
     def create_quote_content(quote_text: str, source_file: str, block_id: str, vault_name: str = "Notes", vault_root: str = "") -> str:
-        from quote_vault_manager import VERSION
         default_frontmatter = f"""delete: false\nfavorite: false\nedited: false\nversion: \"{VERSION}\"\n"""
         return DestinationFile._create_quote_content_template(quote_text, source_file, block_id, default_frontmatter, vault_name, vault_root)
 
     @staticmethod
     def read_quote_file_content(path: str) -> tuple:
         """Reads the file and returns (frontmatter, content) tuple."""
-        from quote_vault_manager.file_utils import split_frontmatter_from_file
         return split_frontmatter_from_file(path)
 
     @classmethod
     def extract_quote_text_from_content(cls, content: str) -> str:
         if content is None:
             return ""
-        lines = content.split('\n')
         quote_lines = []
-        for line in lines:
-            if line.strip().startswith('>'):
-                quote_lines.append(line.lstrip('> ').rstrip())
-            elif line.strip().startswith('**Source:'):
-                break
-        return '\n'.join(quote_lines) if quote_lines else ""
+        for line in content.split('\n'):
+            # Quote lines almost always start with '>' at column 0; only other lines pay for lstrip
+            if line[:1] != '>':
+                stripped = line.lstrip()
+                if stripped[:1] != '>':
+                    if stripped.startswith('**Source:'):
+                        break
+                    continue
+            quote_lines.append(line.lstrip('> ').rstrip())
+        return '\n'.join(quote_lines)
 
     @classmethod
     def frontmatter_str_to_dict(cls, frontmatter: str) -> dict:
-        import yaml
-        try:
-            return yaml.safe_load(frontmatter) or {}
-        except Exception:
-            return {}
+        # Callers mutate the result, so hand out a copy of the cached parse
+        return copy.deepcopy(_load_frontmatter(frontmatter))
 
     @classmethod
     def frontmatter_dict_to_str(cls, frontmatter_dict: dict) -> str:
-        import yaml
         if not frontmatter_dict:
             return ""
+        simple = _dump_simple_frontmatter(frontmatter_dict)
+        if simple is not None:
+            return simple
         try:
             return yaml.safe_dump(frontmatter_dict, sort_keys=False).strip()
         except Exception:
@@ -301,8 +497,4 @@ class DestinationFile:
     @classmethod
     def new(cls, frontmatter: Dict[str, Any], quote: Quote, path: Optional[str] = None, source_path: Optional[str] = None, destination_vault: Optional['DestinationVault'] = None) -> 'DestinationFile':
         """Create a new DestinationFile with is_new=True."""
-        obj = cls(frontmatter, quote, path=path, marked_for_deletion=False, needs_update=False, is_new=True, destination_vault=destination_vault)
-        import os
-        obj.filename = os.path.basename(path) if path else None
-        obj.source_path = source_path
-        return obj 
\ No newline at end of file
+        return cls(frontmatter, quote, path=path, marked_for_deletion=False, needs_update=False, is_new=True, destination_vault=destination_vault, source_path=source_path)
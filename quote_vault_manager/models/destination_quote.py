@@ -2,12 +2,17 @@
 DestinationQuote represents a quote in a destination file with frontmatter.
 """
 
+import logging
+import os
 from typing import Optional, Dict, Any, TYPE_CHECKING
 from .quote import Quote
+from .destination_file import DestinationFile
+from quote_vault_manager.transformations.v0_2_add_random_note_link import RANDOM_NOTE_LINK
 
 if TYPE_CHECKING:
     from .source_quote import SourceQuote
 
+logger = logging.getLogger(__name__)
 
 class DestinationQuote(Quote):
     """
@@ -16,6 +21,7 @@ class DestinationQuote(Quote):
     A DestinationQuote contains the quote text, block ID, and frontmatter metadata,
     and maintains a reference to its source quote.
     """
+    __slots__ = ('frontmatter', 'source_quote', '_destination_file')
     
     def __init__(self, text: str, block_id: Optional[str] = None, *, 
                  frontmatter: Optional[Dict[str, Any]] = None, 
@@ -93,45 +99,37 @@ class DestinationQuote(Quote):
         Sync this destination quote back to its source quote.
         Returns True if changes were made.
         """
-        print(f"  sync_to_source called: is_edited={self.is_edited}, source_quote={self.source_quote is not None}")
+        logger.debug("sync_to_source called: is_edited=%s, source_quote=%s", self.is_edited, self.source_quote is not None)
         if not self.is_edited or not self.source_quote:
-            print(f"  sync_to_source returning False: is_edited={self.is_edited}, has_source_quote={self.source_quote is not None}")
+            logger.debug("sync_to_source returning False: is_edited=%s, has_source_quote=%s", self.is_edited, self.source_quote is not None)
             return False
         
-        print(f"  Comparing texts: dest='{self.text}' vs source='{self.source_quote.text}'")
+        logger.debug("Comparing texts: dest=%r vs source=%r", self.text, self.source_quote.text)
         if self.text != self.source_quote.text:
-            print(f"  Updating source quote text from '{self.source_quote.text}' to '{self.text}'")
+            logger.debug("Updating source quote text from %r to %r", self.source_quote.text, self.text)
             self.source_quote.text = self.text
             self.source_quote.needs_edit = True
             if not dry_run:
                 self.mark_edited(False)
-            print(f"  sync_to_source returning True")
+            logger.debug("sync_to_source returning True")
             return True
         
-        print(f"  sync_to_source returning False: texts are the same")
+        logger.debug("sync_to_source returning False: texts are the same")
         return False
     
     def format_for_destination(self, source_file: str, vault_name: str = "Notes", 
                              vault_root: str = "") -> str:
         """Format this quote for display in a destination file."""
-        from .destination_file import DestinationFile
-        
         # Create the Obsidian URI
         uri = DestinationFile.create_obsidian_uri(source_file, self.block_id or '', vault_name, vault_root)
         
         # Format the quote text with blockquotes
-        lines = self.text.split('\n')
-        formatted_lines = [f'> {line}' for line in lines]
-        quote_text = '\n'.join(formatted_lines)
+        quote_text = self._format_quote_text(self.text)
         
         # Create the source link
-        import os
         link_text = os.path.basename(source_file).replace('.md', '')
         source_link = f"**Source:** [{link_text}]({uri})"
         
-        # Add random note link
-        from quote_vault_manager.transformations.v0_2_add_random_note_link import RANDOM_NOTE_LINK
-        
         return f"{quote_text}\n\n{source_link}\n\n{RANDOM_NOTE_LINK}\n"
     
     def __repr__(self):
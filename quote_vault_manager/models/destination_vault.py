@@ -1,27 +1,62 @@
 from .destination_file import DestinationFile
+from .quote import Quote
+from .source_file import SourceFile
 from .source_vault import SourceVault
 from typing import List, Optional, Dict, Any
 import os
 from .base_vault import BaseVault
-from ..file_utils import get_book_title_from_path
+from ..services.parse_cache import ParseCache
+from ..file_utils import get_book_title_from_path, iter_markdown_files, VAULT_INTERNAL_DIRS
+from quote_vault_manager import VERSION
 
 class DestinationVault(BaseVault):
     files: List[DestinationFile]  # type: ignore
     
     """Represents a collection of destination (quote) files in a vault."""
-    def __init__(self, directory: str, vault_name: str = "", source_vault: Optional['SourceVault'] = None):
+    # Vaults with fewer files than this are parsed in-process even when workers is set
+    PROCESS_POOL_THRESHOLD = 64
+
+    def __init__(self, directory: str, vault_name: str = "", source_vault: Optional['SourceVault'] = None, workers: Optional[int] = None):
+        """
+        Args:
+            workers: If set, large vaults are parsed with this many worker processes.
+                     None (the default) parses in this process.
+        """
         super().__init__(directory, vault_name)
         self.source_vault = source_vault
+        self.workers = workers
+        # Source book title -> the quote files that point to it; built on first use and kept
+        # up to date by this class's own adds and deletes
+        self._files_by_source: Optional[Dict[str, List[DestinationFile]]] = None
+        # Directories already created during the current save pass, or None outside one
+        self._known_dirs: Optional[set] = None
 
     def _load_files(self) -> List[DestinationFile]:
         """Loads all markdown destination files from the directory."""
-        files = []
-        for root, _, filenames in os.walk(self.directory):
-            for filename in filenames:
-                if filename.endswith('.md'):
-                    path = os.path.join(root, filename)
-                    files.append(DestinationFile.from_file(path, destination_vault=self))
-        return files
+        # Backups and caches are never descended into
+        paths = [entry.path for entry in iter_markdown_files(self.directory, skip_dirs=VAULT_INTERNAL_DIRS)]
+        if self.workers and len(paths) >= self.PROCESS_POOL_THRESHOLD:
+            # Parsing is CPU-bound, so threads don't help it; fan it out to processes
+            loaded = ParseCache.get_instance().load_parsed_many(paths, 'destination', DestinationFile._parse_content, self.workers)
+            return [DestinationFile._from_parsed(path, parsed, digest, self) for path, (parsed, digest) in zip(paths, loaded)]
+        # Each load is an independent read + parse, so large vaults are loaded concurrently
+        return self._map_io(lambda path: DestinationFile.from_file(path, destination_vault=self), paths)
+
+    @staticmethod
+    def _source_key(dest: DestinationFile) -> str:
+        """Book title of the source a quote file points to: from its Source link, else its filename."""
+        if dest.source_path:
+            return get_book_title_from_path(dest.source_path)
+        return DestinationFile.extract_book_title_from_filename(dest.filename or '')
+
+    def _get_files_by_source(self) -> Dict[str, List[DestinationFile]]:
+        """Index of quote files by the source they point to, built on first use."""
+        if self._files_by_source is None:
+            index: Dict[str, List[DestinationFile]] = {}
+            for dest in self.files:
+                index.setdefault(self._source_key(dest), []).append(dest)
+            self._files_by_source = index
+        return self._files_by_source
 
     def transform_all(self, transform_fn):
         """Applies a transformation function to all destination files."""
@@ -30,17 +65,35 @@ class DestinationVault(BaseVault):
 
     def commit_changes(self, dry_run: bool = False):
         """Apply all in-memory changes: save new/updated files, delete marked files. Honors dry_run."""
+        to_save = []
+        deleted = set()  # ids of files removed from disk
         for dest in self.files:
             if dest.marked_for_deletion:
                 if not dry_run and dest.path:
                     DestinationFile.delete(dest.path)
+                    deleted.add(id(dest))
                 dest.marked_for_deletion = False
             elif dest.needs_update or dest.is_new:
-                if not dry_run:
-                    if dest.path:
-                        dest.save(dest.path)
+                if not dry_run and dest.path:
+                    to_save.append(dest)
                 dest.needs_update = False
                 dest.is_new = False
+        if deleted:
+            # Drop deleted files so later passes neither scan them nor find them by path;
+            # the list is updated in place as callers may hold a reference to it
+            self.files[:] = [dest for dest in self.files if id(dest) not in deleted]
+            if self._files_by_source is not None:
+                for dests in self._files_by_source.values():
+                    dests[:] = [dest for dest in dests if id(dest) not in deleted]
+        self._save_files(to_save)
+
+    def _save_files(self, files: List[DestinationFile]):  # type: ignore[override]
+        """Save files in one pass that remembers which book folders it has already created."""
+        self._known_dirs = set()
+        try:
+            super()._save_files(files)
+        finally:
+            self._known_dirs = None
 
     def save_all(self):
         """Commits all in-memory changes to disk."""
@@ -48,8 +101,11 @@ class DestinationVault(BaseVault):
 
     def sync_quotes_from_source(self, source_file: str, quotes_with_ids: list, block_id_map: dict, 
                                dry_run: bool = False, vault_name: str = "Notes", 
-                               source_vault_path: Optional[str] = None) -> Dict[str, Any]:
-        """Sync quotes from a source file to this destination vault in memory, marking for update or creation."""
+                               source_vault_path: Optional[str] = None, commit: bool = True) -> Dict[str, Any]:
+        """
+        Sync quotes from a source file to this destination vault in memory, marking for update or creation.
+        With commit=False the changes are left for the caller's next commit_changes.
+        """
         results = {
             'quotes_processed': 0,
             'quotes_created': 0,
@@ -57,8 +113,11 @@ class DestinationVault(BaseVault):
             'errors': []
         }
         book_title = get_book_title_from_path(source_file)
-        # Build a lookup for existing files by (block_id)
-        existing_by_block = {(dest.quote.block_id, dest.path): dest for dest in self.files}
+        # Index files by path once instead of scanning self.files for every quote;
+        # setdefault keeps the first file for a path, as the linear scan did
+        files_by_path: Dict[str, DestinationFile] = {}
+        for dest in self.files:
+            files_by_path.setdefault(dest.path, dest)
         for idx, (quote_text, block_id) in enumerate(quotes_with_ids):
             results['quotes_processed'] += 1
             if block_id is None:
@@ -67,11 +126,7 @@ class DestinationVault(BaseVault):
             filename = DestinationFile.create_quote_filename(book_title, block_id, quote_text)
             quote_file_path = os.path.join(self.directory, book_title, filename)
             # Try to find in-memory file
-            found = None
-            for dest in self.files:
-                if dest.path == quote_file_path:
-                    found = dest
-                    break
+            found = files_by_path.get(quote_file_path)
             if found:
                 updated = False
                 # Don't update quote text if the file is marked as edited
@@ -85,8 +140,6 @@ class DestinationVault(BaseVault):
                     found.needs_update = True
                     results['quotes_updated'] += 1
             else:
-                from .quote import Quote
-                from quote_vault_manager import VERSION
                 frontmatter = {
                     'delete': False,
                     'favorite': False,
@@ -95,81 +148,82 @@ class DestinationVault(BaseVault):
                 }
                 new_dest = DestinationFile.new(frontmatter, Quote(quote_text, block_id), path=quote_file_path, source_path=source_file, destination_vault=self)
                 self.files.append(new_dest)
+                files_by_path[quote_file_path] = new_dest
+                if self._files_by_source is not None:
+                    self._files_by_source.setdefault(self._source_key(new_dest), []).append(new_dest)
                 results['quotes_created'] += 1
-        if not dry_run:
+        if commit and not dry_run:
             self.commit_changes(dry_run=False)
         return results
 
-    def remove_orphaned_quotes_for_source(self, source_file: str, block_id_map: dict, dry_run: bool = False) -> Dict[str, Any]:
-        """Mark quote files that no longer have a corresponding blockquote in the source file for deletion."""
+    def remove_orphaned_quotes_for_source(self, source_file: str, block_id_map: dict, dry_run: bool = False, commit: bool = True) -> Dict[str, Any]:
+        """
+        Mark quote files that no longer have a corresponding blockquote in the source file for deletion.
+        With commit=False the changes are left for the caller's next commit_changes.
+        """
         results = {
             'quotes_deleted': 0,
             'errors': []
         }
         existing_block_ids = set(block_id_map.values())
-        for dest in self.files:
+        # Block IDs are only unique within a source, so only look at the quote files
+        # that point to this source, wherever they sit in the vault
+        for dest in self._get_files_by_source().get(get_book_title_from_path(source_file), []):
             block_id = dest.quote.block_id
             if block_id and block_id not in existing_block_ids:
                 dest.marked_for_deletion = True
                 results['quotes_deleted'] += 1
-        if not dry_run:
+        if commit and not dry_run:
             self.commit_changes(dry_run=False)
         return results
 
     def delete_flagged(self, source_vault_path: str, dry_run: bool = False) -> dict:
         """Mark all quote files with a delete flag for deletion. Unwrap quotes in source if needed."""
-        from .source_file import SourceFile
         results = {
             'quotes_unwrapped': 0,
             'errors': []
         }
+        resolved_paths: Dict[str, Optional[str]] = {}  # dest.source_path -> source file path, or None
+        sources: Dict[str, SourceFile] = {}  # each source file is parsed once per call
         for dest in self.files:
             if not dest.is_marked_for_deletion:
                 continue
             if not dest.source_path:
                 continue
-            source_path = dest.source_path
-            if source_path and not source_path.endswith('.md'):
-                source_path = source_path + '.md'
-            source_file_path = os.path.join(source_vault_path, source_path) if source_vault_path else source_path
-            if not os.path.exists(source_file_path):
+            if dest.source_path not in resolved_paths:
+                source_path = dest.source_path
+                if not source_path.endswith('.md'):
+                    source_path = source_path + '.md'
+                source_file_path = os.path.join(source_vault_path, source_path) if source_vault_path else source_path
+                resolved_paths[dest.source_path] = source_file_path if os.path.exists(source_file_path) else None
+            source_file_path = resolved_paths[dest.source_path]
+            if source_file_path is None:
                 error_msg = f"Could not find source file {dest.source_path} in {source_vault_path} for quote file {dest.path}"
                 results['errors'].append(error_msg)
                 continue
             block_id = dest.quote.block_id
             if not block_id:
                 continue
-            source = SourceFile.from_file(source_file_path)
-            # Find the Quote object by block_id
-            quote_obj = None
-            for q in source.quotes:
-                if q.block_id == block_id:
-                    quote_obj = q
-                    break
-            if quote_obj is None:
+            source = sources.get(source_file_path)
+            if source is None:
+                source = sources[source_file_path] = SourceFile.from_file(source_file_path)
+            quote_obj = source.get_quote(block_id)
+            # A quote already unwrapped during this call is gone from the source
+            if quote_obj is None or quote_obj.needs_unwrap:
                 continue
             unwrapped = source.unwrap_quote(quote_obj)
             if unwrapped:
-                if not dry_run:
-                    source.save()
                 results['quotes_unwrapped'] += 1
             dest.marked_for_deletion = True
         if not dry_run:
+            # One save per source file, however many of its quotes were unwrapped
+            for source in sources.values():
+                source.save()
             self.commit_changes(dry_run=False)
         return results
 
     def find_quote_files_for_source(self, source_file: str) -> list:
-        import os
-        quote_files = []
-        source_filename = os.path.basename(source_file)
-        source_name = source_filename.replace('.md', '')
-        
-        # Look for quote files in the subdirectory named after the source file
-        source_dir = os.path.join(self.directory, source_name)
-        if os.path.exists(source_dir):
-            for root, _, files in os.walk(source_dir):
-                for file in files:
-                    if file.endswith('.md'):
-                        quote_files.append(os.path.join(root, file))
-        
-        return quote_files 
\ No newline at end of file
+        # Look for quote files in the subdirectory named after the source file,
+        # the same book title sync_quotes_from_source writes them under
+        source_dir = os.path.join(self.directory, get_book_title_from_path(source_file))
+        return [entry.path for entry in iter_markdown_files(source_dir)] 
\ No newline at end of file
@@ -9,6 +9,9 @@ class Quote:
         needs_unwrap: If True, quote needs to be unwrapped in source file.
         needs_block_id_assignment: If True, block ID needs to be written to file.
     """
+    # One instance per quote in every synced book; slots keep them small
+    __slots__ = ('text', 'block_id', 'needs_edit', 'needs_unwrap', 'needs_block_id_assignment')
+
     def __init__(self, text: Optional[str], block_id: Optional[str], needs_edit: bool = False, needs_unwrap: bool = False, needs_block_id_assignment: bool = False):
         self.text = text
         self.block_id = block_id
@@ -22,14 +25,15 @@ class Quote:
     def __eq__(self, other):
         if not isinstance(other, Quote):
             return NotImplemented
-        return self.text == other.text and self.block_id == other.block_id
+        # Block IDs are short, so compare them before the (possibly long) text
+        return self.block_id == other.block_id and self.text == other.text
 
     def differs_from(self, other: 'Quote') -> bool:
         """Checks if this quote differs from another quote."""
-        return self.text != other.text or self.block_id != other.block_id 
+        return self.block_id != other.block_id or self.text != other.text 
 
     @staticmethod
     def _format_quote_text(quote_text: str) -> str:
         """Format quote text with proper blockquote formatting."""
-        quote_lines = quote_text.split('\n')
-        return '\n'.join(f'> {line}' for line in quote_lines) 
\ No newline at end of file
+        # Prefix every line with '> ' in one pass, without an intermediate list of lines
+        return '> ' + quote_text.replace('\n', '\n> ') 
\ No newline at end of file
@@ -1,16 +1,33 @@
-from .quote import Quote
-from typing import List, Optional, Tuple, Set
+import os
 import re
+from typing import Dict, List, Optional, Tuple, Set
+from .quote import Quote
+from .destination_file import DestinationFile
+from quote_vault_manager.services.parse_cache import ParseCache
 
 class SourceFile:
     """Represents a source file containing multiple quotes."""
+    __slots__ = ('path', 'quotes', '_quote_by_block_id', '_block_id_errors', '_next_block_id')
     
     # Block ID pattern for source files
     BLOCK_ID_PATTERN = re.compile(r'^\^Quote(\d{3})$', re.MULTILINE)
+    # Block ID on its own line, allowing the surrounding whitespace that line.strip() would drop.
+    # Lines end at the same characters str.splitlines() splits on, not just '\n'
+    LINE_BREAKS = '\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029'
+    BLOCK_ID_LINE_PATTERN = re.compile(
+        r'(?:\A|(?<=[%s]))\s*\^Quote(\d{3})\s*(?=[%s]|\Z)' % (LINE_BREAKS, LINE_BREAKS)
+    )
+    # ParseCache namespace; change it whenever _parse_content's output changes shape
+    CACHE_KIND = 'source'
     
     def __init__(self, path: str, quotes: List[Quote]):
         self.path = path
         self.quotes = quotes
+        self._quote_by_block_id: Optional[Dict[str, Quote]] = None
+        # Derived from the file content by from_file, so validation and block ID
+        # assignment need not re-read the file; None means read it on demand
+        self._block_id_errors: Optional[List[str]] = None
+        self._next_block_id: Optional[str] = None
 
     def __repr__(self):
         return f"SourceFile(path={self.path!r}, quotes={self.quotes!r})"
@@ -18,38 +35,61 @@ class SourceFile:
     @classmethod
     def from_file(cls, path: str) -> 'SourceFile':
         """Parses the file at path and returns a SourceFile with all quotes."""
-        quotes = []
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        for quote_text, block_id in cls.extract_blockquotes_with_ids(content):
-            quotes.append(Quote(quote_text, block_id))
-        return cls(path, quotes)
+        parsed = ParseCache.get_instance().load_parsed(path, cls.CACHE_KIND, cls._parse_content)
+        quote_pairs, block_id_errors, next_block_id = parsed
+        quotes = [Quote(quote_text, block_id) for quote_text, block_id in quote_pairs]
+        source = cls(path, quotes)
+        source._block_id_errors = list(block_id_errors)
+        source._next_block_id = next_block_id
+        return source
+
+    @classmethod
+    def _parse_content(cls, content: str) -> Tuple[Tuple[Tuple[str, Optional[str]], ...], Tuple[str, ...], str]:
+        """
+        Parses file content into an immutable tuple of the quotes as (quote_text, block_id)
+        pairs, the block ID validation errors and the next free block ID.
+        """
+        return (
+            tuple((quote_text, block_id) for quote_text, block_id in cls.extract_blockquotes_with_ids(content)),
+            tuple(cls.validate_block_ids_from_content(content)),
+            cls.get_next_block_id(content),
+        )
+
+    def _read_content(self) -> str:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return f.read()
 
     def validate_block_ids(self) -> List[str]:
         """Validates block IDs in the source file and returns a list of errors."""
-        with open(self.path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return self.validate_block_ids_from_content(content)
+        if self._block_id_errors is not None:
+            return list(self._block_id_errors)
+        return self.validate_block_ids_from_content(self._read_content())
 
     def assign_missing_block_ids(self, dry_run: bool = False) -> int:
         """Assigns missing block IDs to quotes. Returns the number of block IDs added. Only sets flags; file update is deferred to save()."""
         block_ids_added = 0
-        with open(self.path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        next_block_id = self.get_next_block_id(content)
-        used_ids = set(q.block_id for q in self.quotes if q.block_id)
+        if not any(not quote.block_id and quote.text for quote in self.quotes):
+            return 0
+        next_block_id = self._next_block_id or self.get_next_block_id(self._read_content())
+        # Work with the numeric part of the IDs; the string is only formatted on assignment
+        next_num = int(next_block_id[len('^Quote'):])
+        used_nums = set()
+        for q in self.quotes:
+            if q.block_id and q.block_id.startswith('^Quote') and q.block_id[6:].isdigit():
+                num = int(q.block_id[6:])
+                # Only IDs in the canonical form can collide with a generated one
+                if f'^Quote{num:03d}' == q.block_id:
+                    used_nums.add(num)
         for quote in self.quotes:
             if not quote.block_id and quote.text:
                 # Assign a new block ID
-                while next_block_id in used_ids:
-                    num = int(next_block_id.replace('^Quote', '')) + 1
-                    next_block_id = f'^Quote{num:03d}'
-                quote.block_id = next_block_id
+                while next_num in used_nums:
+                    next_num += 1
+                quote.block_id = f'^Quote{next_num:03d}'
                 quote.needs_block_id_assignment = True
-                used_ids.add(next_block_id)
+                used_nums.add(next_num)
                 block_ids_added += 1
-                num = int(next_block_id.replace('^Quote', '')) + 1
-                next_block_id = f'^Quote{num:03d}'
+                next_num += 1
         return block_ids_added
 
 
@@ -110,11 +150,7 @@ class SourceFile:
         Finds the highest existing block ID in the markdown and returns the next sequential ID.
         If no block IDs exist, returns '^Quote001'.
         """
-        existing_ids = []
-        for line in markdown.splitlines():
-            match = SourceFile.BLOCK_ID_PATTERN.match(line.strip())
-            if match:
-                existing_ids.append(int(match.group(1)))
+        existing_ids = [int(num) for num in SourceFile.BLOCK_ID_LINE_PATTERN.findall(markdown)]
         
         if not existing_ids:
             return '^Quote001'
@@ -125,15 +161,30 @@ class SourceFile:
     def add_quote(self, text: Optional[str], block_id: Optional[str] = None):
         """Adds a new quote to the source file object."""
         self.quotes.append(Quote(text, block_id))
+        self._quote_by_block_id = None
 
     def remove_quote(self, block_id: str) -> bool:
         """Removes a quote by block ID. Returns True if removed, False if not found."""
         for i, quote in enumerate(self.quotes):
             if quote.block_id == block_id:
                 del self.quotes[i]
+                self._quote_by_block_id = None
                 return True
         return False
 
+    def get_quote(self, block_id: str) -> Optional[Quote]:
+        """Returns the first quote with the given block ID, or None."""
+        index = self._quote_by_block_id
+        quote = index.get(block_id) if index is not None else None
+        if quote is None or quote.block_id != block_id:
+            # Built on first use, and rebuilt on a miss in case quotes or block IDs changed since
+            index = self._quote_by_block_id = {}
+            for q in self.quotes:
+                if q.block_id:
+                    index.setdefault(q.block_id, q)
+            quote = index.get(block_id)
+        return quote
+
     def unwrap_quote(self, quote: Quote) -> bool:
         """Unwraps a quote and marks it for unwrapping."""
         if quote:
@@ -144,24 +195,42 @@ class SourceFile:
 
     def save(self, dry_run: bool = False):
         """Propagates edits, unwrapping, and block ID assignments for quotes with flags set, using in-place file updates only."""
+        unwrap_block_ids = set()
+        # Block IDs are inserted into one in-memory copy of the file, which is written
+        # once, before anything else rewrites the file and at the end
+        lines: Optional[List[str]] = None
+        lines_modified = False
         for quote in self.quotes:
             if getattr(quote, "needs_edit", False):
                 if quote.block_id is not None and quote.text is not None:
+                    if lines_modified:
+                        self._write_lines(lines)
+                    lines, lines_modified = None, False
                     self.overwrite_quote_in_source(self.path, quote.block_id, quote.text, dry_run)
                 quote.needs_edit = False
             if getattr(quote, "needs_unwrap", False):
                 if quote.block_id is not None:
-                    self.unwrap_quote_in_source(self.path, quote.block_id, dry_run)
+                    unwrap_block_ids.add(quote.block_id)
                 quote.needs_unwrap = False
             if getattr(quote, "needs_block_id_assignment", False):
-                # Write the block ID to the file (unless dry_run)
-                self._write_block_id_to_file(quote, dry_run)
+                if not dry_run and quote.block_id:
+                    if lines is None:
+                        lines = self._read_lines()
+                    if lines is not None and self._insert_block_id(lines, quote):
+                        lines_modified = True
                 quote.needs_block_id_assignment = False
+        if lines_modified:
+            self._write_lines(lines)
+        if unwrap_block_ids:
+            # All unwraps share one read/rewrite of the file
+            self.unwrap_quotes_in_source(self.path, unwrap_block_ids, dry_run)
+        # The file may have changed; derive these from it again if they are needed
+        self._block_id_errors = None
+        self._next_block_id = None
 
     @staticmethod
     def build_source_file_path(source_path: str, source_vault_path: str) -> Optional[str]:
         """Build full path to source file, ensuring .md extension."""
-        import os
         if not isinstance(source_path, str) or not source_path:
             return None
         # Ensure .md extension
@@ -174,7 +243,6 @@ class SourceFile:
     @staticmethod
     def overwrite_quote_in_source(source_file_path: str, block_id: str, new_quote_text: str, dry_run: bool = False) -> bool:
         """Overwrite a quote in the source file (by block ID) with new text, preserving blockquote formatting and block ID. Only the relevant blockquote section is updated."""
-        import os
         if not os.path.exists(source_file_path):
             return False
         try:
@@ -206,10 +274,11 @@ class SourceFile:
             new_blockquote = formatted_new
             if old_blockquote == new_blockquote:
                 return False
-            new_lines = lines[:start] + new_blockquote + [block_id] + lines[end+1:]
             if not dry_run:
+                # Splice the new quote in place rather than copying every line into a new list
+                lines[start:end + 1] = new_blockquote + [block_id]
                 with open(source_file_path, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(new_lines))
+                    f.write('\n'.join(lines))
             return True
         except Exception:
             return False
@@ -232,7 +301,6 @@ class SourceFile:
             return False
         updated = cls.overwrite_quote_in_source(source_file_path, block_id, new_quote_text, dry_run)
         if updated and not dry_run:
-            from quote_vault_manager.models.destination_file import DestinationFile
             dest = DestinationFile.from_file(file_path)
             dest.update_frontmatter({'edited': False})
         return updated 
@@ -251,9 +319,9 @@ class SourceFile:
         return quote_lines, i
 
     @staticmethod
-    def _process_blockquote_section(lines: list, i: int, target_block_id: str) -> tuple:
+    def _process_blockquote_section(lines: list, i: int, target_block_ids: Set[str]) -> tuple:
         quote_lines, i = SourceFile._collect_blockquote_lines(lines, i)
-        if i < len(lines) and lines[i].strip() == target_block_id:
+        if i < len(lines) and lines[i].strip() in target_block_ids:
             quote_text = '\n'.join(quote_lines)
             return [f'"{quote_text}"'], i + 1, True
         else:
@@ -303,8 +371,8 @@ class SourceFile:
     @staticmethod
     def _format_quote_text(quote_text: str) -> str:
         """Format quote text with proper blockquote formatting."""
-        quote_lines = quote_text.split('\n')
-        return '\n'.join(f'> {line}' for line in quote_lines)
+        # Prefix every line with '> ' in one pass, without an intermediate list of lines
+        return '> ' + quote_text.replace('\n', '\n> ')
 
     @staticmethod
     def _replace_blockquote(lines: list, start: int, end: int, new_quote_text: str, block_id: str):
@@ -313,7 +381,11 @@ class SourceFile:
 
     @staticmethod
     def unwrap_quote_in_source(source_file_path: str, block_id: str, dry_run: bool = False) -> bool:
-        import os
+        return SourceFile.unwrap_quotes_in_source(source_file_path, {block_id}, dry_run)
+
+    @staticmethod
+    def unwrap_quotes_in_source(source_file_path: str, block_ids: Set[str], dry_run: bool = False) -> bool:
+        """Unwrap every blockquote whose block ID is in block_ids, rewriting the file at most once."""
         if not os.path.exists(source_file_path):
             return False
         try:
@@ -326,7 +398,7 @@ class SourceFile:
             while i < len(lines):
                 line = lines[i]
                 if SourceFile._is_blockquote_line(line):
-                    processed_lines, new_i, was_unwrapped = SourceFile._process_blockquote_section(lines, i, block_id)
+                    processed_lines, new_i, was_unwrapped = SourceFile._process_blockquote_section(lines, i, block_ids)
                     new_lines.extend(processed_lines)
                     i = new_i
                     if was_unwrapped:
@@ -341,16 +413,19 @@ class SourceFile:
         except Exception:
             return False 
 
-    def _write_block_id_to_file(self, quote: Quote, dry_run: bool = False):
-        """Helper to write the assigned block ID to the correct place in the file."""
-        if not quote.block_id:
-            return
-        import os
+    def _read_lines(self) -> Optional[List[str]]:
+        """Return the lines of the file at self.path, or None if it doesn't exist."""
         if not os.path.exists(self.path):
-            return
+            return None
         with open(self.path, 'r', encoding='utf-8') as f:
-            lines = f.read().splitlines()
-        # Find the blockquote matching the quote text, and insert the block ID after it if not present
+            return f.read().splitlines()
+
+    def _write_lines(self, lines: List[str]):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines))
+
+    def _insert_block_id(self, lines: List[str], quote: Quote) -> bool:
+        """Insert the quote's block ID after the first blockquote matching its text, unless it already has one. Returns True if lines changed."""
         i = 0
         while i < len(lines):
             if self._is_blockquote_line(lines[i]):
@@ -360,13 +435,11 @@ class SourceFile:
                     # Check if next line is a block ID
                     if next_i < len(lines) and self.BLOCK_ID_PATTERN.match(lines[next_i].strip()):
                         # Already has a block ID, skip
-                        return
+                        return False
                     # Insert block ID after quote
-                    new_lines = lines[:next_i] + [quote.block_id] + lines[next_i:]
-                    if not dry_run:
-                        with open(self.path, 'w', encoding='utf-8') as f:
-                            f.write('\n'.join(new_lines))
-                    return
+                    lines.insert(next_i, quote.block_id)
+                    return True
                 i = next_i
             else:
-                i += 1 
\ No newline at end of file
+                i += 1
+        return False 
\ No newline at end of file
@@ -16,6 +16,7 @@ class SourceQuote(Quote):
     A SourceQuote contains the original quote text and block ID, and can track
     whether it has been edited in the destination vault.
     """
+    __slots__ = ('_destination_quotes',)
     
     def __init__(self, text: str, block_id: Optional[str] = None, *, 
                  needs_block_id_assignment: bool = False, needs_edit: bool = False, 
@@ -75,9 +76,7 @@ class SourceQuote(Quote):
     
     def format_for_source(self) -> str:
         """Format this quote for display in a source file."""
-        lines = self.text.split('\n')
-        formatted_lines = [f'> {line}' for line in lines]
-        result = '\n'.join(formatted_lines)
+        result = self._format_quote_text(self.text)
         if self.block_id:
             result += f'\n{self.block_id}'
         return result
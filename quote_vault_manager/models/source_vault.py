@@ -2,6 +2,7 @@ from .source_file import SourceFile
 from typing import List
 import os
 from .base_vault import BaseVault
+from quote_vault_manager.file_utils import get_markdown_files, filter_sync_quote_files
 from quote_vault_manager.services.source_sync import sync_source_file
 
 class SourceVault(BaseVault):
@@ -12,15 +13,8 @@ class SourceVault(BaseVault):
 
     def _load_files(self) -> List[SourceFile]:
         """Loads all markdown source files from the directory that have sync_quotes: true in frontmatter."""
-        files = []
-        from quote_vault_manager.file_utils import has_sync_quotes_flag
-        for root, _, filenames in os.walk(self.directory):
-            for filename in filenames:
-                if filename.endswith('.md'):
-                    path = os.path.join(root, filename)
-                    if has_sync_quotes_flag(path):
-                        files.append(SourceFile.from_file(path))
-        return files
+        paths = filter_sync_quote_files(get_markdown_files(self.directory))
+        return [SourceFile.from_file(path) for path in paths]
 
     def validate_all(self) -> List[str]:
         """Validates block IDs in all source files and returns a list of errors."""
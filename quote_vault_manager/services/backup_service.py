@@ -1,11 +1,28 @@
 import os
 import shutil
 import glob
-from datetime import datetime, timedelta
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple
+from quote_vault_manager.file_utils import iter_markdown_files, VAULT_INTERNAL_DIRS
+
+@lru_cache(maxsize=1)
+def _date_folder(day_ordinal: int) -> str:
+    """Backup folder date for a day, formatted once per day rather than per call."""
+    return date.fromordinal(day_ordinal).strftime("%Y_%m_%d")
+
+
+@lru_cache(maxsize=None)
+def _version_folder(version: str) -> str:
+    """Backup folder prefix for a version, e.g. 'V0.2' -> 'v0_2'."""
+    return version.lower().replace('.', '_')
+
 
 class BackupService:
     _instance = None
+    # Copying is I/O-bound, so threads overlap the per-file open/read/write latency
+    MAX_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
     def __init__(self):
         pass
@@ -18,8 +35,8 @@ class BackupService:
 
     def create_backup_path(self, destination_vault_path: str, version: str) -> str:
         """Create backup directory path in format v0_2_YYYY_MM_DD/."""
-        version_folder = version.lower().replace('.', '_')
-        date_str = datetime.now().strftime("%Y_%m_%d")
+        version_folder = _version_folder(version)
+        date_str = _date_folder(date.today().toordinal())
         backup_dir = os.path.join(destination_vault_path, ".backup", f"{version_folder}_{date_str}")
         return backup_dir
 
@@ -31,19 +48,51 @@ class BackupService:
         backup_path = self.create_backup_path(destination_vault_path, version)
         if not dry_run:
             os.makedirs(backup_path, exist_ok=True)
-            for root, dirs, files in os.walk(destination_vault_path):
-                if '.backup' in root:
-                    continue
-                for file in files:
-                    if file.endswith('.md'):
-                        rel_path = os.path.relpath(root, destination_vault_path)
-                        backup_file_dir = os.path.join(backup_path, rel_path)
-                        os.makedirs(backup_file_dir, exist_ok=True)
-                        src_file = os.path.join(root, file)
-                        dst_file = os.path.join(backup_file_dir, file)
-                        shutil.copy2(src_file, dst_file)
+            copy_pairs = []
+            backup_dirs = set()
+            for entry in iter_markdown_files(destination_vault_path, skip_dirs=VAULT_INTERNAL_DIRS):
+                rel_path = os.path.relpath(os.path.dirname(entry.path), destination_vault_path)
+                backup_file_dir = os.path.normpath(os.path.join(backup_path, rel_path))
+                backup_dirs.add(backup_file_dir)
+                copy_pairs.append((entry.path, os.path.join(backup_file_dir, entry.name)))
+            # One makedirs per unique directory; sorted so parents exist before their children
+            backup_dirs.discard(os.path.normpath(backup_path))
+            for backup_file_dir in sorted(backup_dirs):
+                os.makedirs(backup_file_dir, exist_ok=True)
+            copy_fn = shutil.copy2
+            if hasattr(os, 'copy_file_range') and os.stat(destination_vault_path).st_dev == os.stat(backup_path).st_dev:
+                copy_fn = self._copy_file_in_kernel
+            self._copy_files(copy_pairs, copy_fn)
         return backup_path
 
+    def _copy_files(self, copy_pairs: List[Tuple[str, str]], copy_fn: Callable[[str, str], Any] = shutil.copy2) -> None:
+        """Copy (src, dst) pairs concurrently. Re-raises the first copy error."""
+        if not copy_pairs:
+            return
+        with ThreadPoolExecutor(max_workers=self.MAX_COPY_WORKERS) as executor:
+            futures = [executor.submit(copy_fn, src, dst) for src, dst in copy_pairs]
+            for future in futures:
+                future.result()
+
+    @staticmethod
+    def _copy_file_in_kernel(src: str, dst: str) -> None:
+        """
+        Copy src to dst with os.copy_file_range, preserving metadata like shutil.copy2.
+        On copy-on-write filesystems this becomes a reflink. Falls back to shutil.copy2
+        if the kernel or filesystem rejects the call.
+        """
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
     def cleanup_old_backups(self, destination_vault_path: str, dry_run: bool = False) -> List[str]:
         """
         Remove backup directories older than a week.
@@ -52,16 +101,19 @@ class BackupService:
         backup_root = os.path.join(destination_vault_path, ".backup")
         if not os.path.exists(backup_root):
             return []
-        cutoff_date = datetime.now() - timedelta(days=7)
+        # A backup dated on or before this day is more than a week old
+        cutoff_date = date.today() - timedelta(days=7)
         removed_backups = []
-        for backup_dir in os.listdir(backup_root):
-            backup_path = os.path.join(backup_root, backup_dir)
-            if not os.path.isdir(backup_path):
-                continue
+        with os.scandir(backup_root) as it:
+            backup_entries = [entry for entry in it if entry.is_dir()]
+        for entry in backup_entries:
+            backup_dir = entry.name
+            backup_path = entry.path
             try:
                 date_part = backup_dir.split('_', 2)[-1]
-                backup_date = datetime.strptime(date_part, "%Y_%m_%d")
-                if backup_date < cutoff_date:
+                year, month, day = map(int, date_part.split('_'))
+                backup_date = date(year, month, day)
+                if backup_date <= cutoff_date:
                     if not dry_run:
                         shutil.rmtree(backup_path)
                     removed_backups.append(backup_path)
@@ -74,9 +126,5 @@ class BackupService:
         backup_root = os.path.join(destination_vault_path, ".backup")
         if not os.path.exists(backup_root):
             return 0
-        count = 0
-        for item in os.listdir(backup_root):
-            item_path = os.path.join(backup_root, item)
-            if os.path.isdir(item_path):
-                count += 1
-        return count 
\ No newline at end of file
+        with os.scandir(backup_root) as it:
+            return sum(1 for entry in it if entry.is_dir()) 
\ No newline at end of file
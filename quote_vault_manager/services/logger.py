@@ -1,24 +1,58 @@
+import atexit
 import logging
+import logging.handlers
 import os
-from typing import Dict, Any, Tuple, Optional
-from datetime import datetime
+import queue
+import weakref
+from typing import Dict, Any, List, Tuple, Optional
+import time
+
+# (epoch second, formatted timestamp) of the last sync action; reused within the same second
+_LAST_TS: Tuple[int, str] = (0, '')
+
+
+def _timestamp() -> str:
+    """Current local time as 'YYYY-MM-DD HH:MM:SS', formatted at most once per second."""
+    global _LAST_TS
+    sec = int(time.time())
+    if sec != _LAST_TS[0]:
+        _LAST_TS = (sec, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec)))
+    return _LAST_TS[1]
+
+
+# Loggers whose records go through a listener thread; one exit hook closes them all
+_BACKGROUND_LOGGERS: 'weakref.WeakSet[Logger]' = weakref.WeakSet()
+
+
+def _close_background_loggers() -> None:
+    for logger in list(_BACKGROUND_LOGGERS):
+        logger.close()
+
+
+atexit.register(_close_background_loggers)
+
 
 class Logger:
     _instance = None
     _STD_LOGGER_NAME = 'quote_vault_manager.std'
     _ERR_LOGGER_NAME = 'quote_vault_manager.err'
+    _DIVIDING_LINE = '==== SYNC ACTION [%s] ===='
 
-    def __init__(self, std_log_path: str = '', err_log_path: str = ''):
+    def __init__(self, std_log_path: str = '', err_log_path: str = '', background: bool = False):
         self.std_log_path = std_log_path
         self.err_log_path = err_log_path
+        # Write records from a listener thread instead of the logging call
+        self.background = background
         self.std_logger: logging.Logger = logging.getLogger(self._STD_LOGGER_NAME)
         self.err_logger: logging.Logger = logging.getLogger(self._ERR_LOGGER_NAME)
+        self._listeners: List[logging.handlers.QueueListener] = []
+        self._handlers: List[logging.Handler] = []
         self.setup()
 
     @classmethod
-    def get_instance(cls, std_log_path: str = '', err_log_path: str = ''):
+    def get_instance(cls, std_log_path: str = '', err_log_path: str = '', background: bool = False):
         if cls._instance is None:
-            cls._instance = cls(std_log_path, err_log_path)
+            cls._instance = cls(std_log_path, err_log_path, background)
         return cls._instance
 
     def _create_file_handler(self, path: str, level: int) -> logging.FileHandler:
@@ -33,25 +67,60 @@ class Logger:
         logger = logging.getLogger(name)
         logger.setLevel(level)
         logger.handlers.clear()
-        if log_path:
-            logger.addHandler(self._create_file_handler(log_path, level))
+        if not log_path:
+            return logger
+        handler = self._create_file_handler(log_path, level)
+        self._handlers.append(handler)
+        if self.background:
+            # Callers only enqueue records; a listener thread does the file I/O
+            record_queue: queue.Queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(record_queue, handler, respect_handler_level=True)
+            listener.start()
+            self._listeners.append(listener)
+            _BACKGROUND_LOGGERS.add(self)
+            logger.addHandler(logging.handlers.QueueHandler(record_queue))
+        else:
+            logger.addHandler(handler)
         return logger
 
     def setup(self):
+        # Shut down the listeners and files of any earlier setup before building new ones
+        self.close()
         self.std_logger = self._setup_logger(self._STD_LOGGER_NAME, self.std_log_path, logging.INFO)
         self.err_logger = self._setup_logger(self._ERR_LOGGER_NAME, self.err_log_path, logging.ERROR)
 
+    def flush(self) -> None:
+        """Write any queued log records to their files."""
+        for listener in self._listeners:
+            # The listener marks each record done once its handler has it
+            listener.queue.join()
+        for handler in self._handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        """Write out queued records, stop the listener threads and close the log files."""
+        for listener in self._listeners:
+            listener.stop()
+        for handler in self._handlers:
+            handler.close()
+        self._listeners = []
+        self._handlers = []
+        _BACKGROUND_LOGGERS.discard(self)
+
     def log_sync_action(self, action: str, details: str, dry_run: bool = False) -> None:
         logger = self.std_logger or logging.getLogger(self._STD_LOGGER_NAME)
-        dt_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        dividing_line = f"==== SYNC ACTION [{dt_str}] ===="
-        logger.info(dividing_line)
+        # Skip timestamp and message building entirely when nothing would be written
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(self._DIVIDING_LINE, _timestamp())
         prefix = "[DRY-RUN] " if dry_run else ""
-        logger.info(f"{prefix}{action}: {details}")
+        logger.info('%s%s: %s', prefix, action, details)
 
     def log_error(self, error: str, context: str = "") -> None:
         logger = self.err_logger or logging.getLogger(self._ERR_LOGGER_NAME)
+        if not logger.isEnabledFor(logging.ERROR):
+            return
         if context:
-            logger.error(f"{context}: {error}")
+            logger.error('%s: %s', context, error)
         else:
-            logger.error(error) 
\ No newline at end of file
+            logger.error('%s', error) 
\ No newline at end of file
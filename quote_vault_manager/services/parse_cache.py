@@ -0,0 +1,234 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _decode(data: bytes) -> str:
+    """Decode file bytes the way a text-mode read would: UTF-8 with universal newlines."""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _freeze(value: Any) -> Any:
+    """Turn lists into tuples, recursively, so cached entries can be shared instead of copied."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _freeze(item) for key, item in value.items()}
+    return value
+
+
+def _read_and_parse(path: str, parse_fn: Callable[[str], Any]) -> Tuple[bytes, Any]:
+    """Worker for load_parsed_many: read path and return (sha256 digest, parse_fn(content))."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return hashlib.sha256(data).digest(), parse_fn(_decode(data))
+
+
+class ParseCache:
+    """
+    Content-hash cache of parsed markdown files.
+
+    Entries are keyed by the SHA-256 of the raw file bytes, so unchanged files
+    skip YAML and quote parsing and edited files are invalidated automatically.
+    A path index maps each file's (mtime_ns, size) to its digest, so files that
+    haven't been touched since the last run are served without being read.
+    The cache lives in memory and is persisted to
+    <destination_vault>/.qvm-cache/parse.json between runs. Until load() is
+    called every lookup just reads and parses, so callers outside a sync run
+    don't grow the process-wide instance.
+
+    Entries are handed out shared, not copied: lists in parse_fn results are
+    frozen into tuples, and parse_fn should not return mutable dicts that
+    callers change.
+    """
+    _instance = None
+    CACHE_DIR = ".qvm-cache"
+    CACHE_FILE = "parse.json"
+    # Files modified this recently may change again within the same mtime tick,
+    # so they are always read (the "racy timestamp" problem)
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self):
+        self.cache_path: Optional[str] = None
+        self.entries: Dict[str, Any] = {}
+        # path -> [mtime_ns, size, sha256 hex digest]
+        self.paths: Dict[str, List[Any]] = {}
+        self._used_keys: set = set()
+        self._used_paths: set = set()
+        self._dirty = False
+        # Vaults load and save files on a thread pool; every read-modify-write of the
+        # dicts and sets above happens under this lock
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def get_cache_dir(self, destination_vault_path: str) -> str:
+        """Return the cache directory for the given destination vault."""
+        return os.path.join(destination_vault_path, self.CACHE_DIR)
+
+    def load(self, destination_vault_path: str) -> None:
+        """Load persisted entries for the given destination vault, if any."""
+        self.cache_path = os.path.join(self.get_cache_dir(destination_vault_path), self.CACHE_FILE)
+        self._used_keys = set()
+        self._used_paths = set()
+        self._dirty = False
+        self.entries, self.paths = {}, {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and isinstance(data.get('entries'), dict):
+            # JSON has no tuples; refreeze so loaded entries match freshly parsed ones
+            self.entries = {key: _freeze(entry) for key, entry in data['entries'].items()}
+            paths = data.get('paths')
+            self.paths = paths if isinstance(paths, dict) else {}
+
+    def save(self) -> None:
+        """Persist the entries and paths used during this run, dropping stale ones."""
+        if not self.cache_path:
+            return
+        live_entries = {k: v for k, v in self.entries.items() if k in self._used_keys}
+        live_paths = {k: v for k, v in self.paths.items() if k in self._used_paths}
+        if not self._dirty and len(live_entries) == len(self.entries) and len(live_paths) == len(self.paths):
+            return
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'entries': live_entries, 'paths': live_paths}, f)
+        self.entries = live_entries
+        self.paths = live_paths
+        self._dirty = False
+
+    def clear(self, destination_vault_path: str) -> None:
+        """Remove the persisted cache and forget all in-memory entries."""
+        cache_dir = self.get_cache_dir(destination_vault_path)
+        if os.path.isdir(cache_dir):
+            shutil.rmtree(cache_dir)
+        self.entries = {}
+        self.paths = {}
+        self._used_keys = set()
+        self._used_paths = set()
+        self._dirty = False
+
+    def forget(self, path: str) -> None:
+        """Drop the path index entry for a file that has been deleted."""
+        with self._lock:
+            if self.paths.pop(path, None) is not None:
+                self._dirty = True
+            self._used_paths.discard(path)
+
+    def load_parsed(self, path: str, kind: str, parse_fn: Callable[[str], Any]) -> Any:
+        """
+        Read the file at path once and return parse_fn(content), served from the
+        cache when the file bytes are unchanged. kind namespaces entries so the
+        same bytes parsed as a source and a destination file don't collide.
+        """
+        return self.load_parsed_with_digest(path, kind, parse_fn)[0]
+
+    def load_parsed_with_digest(self, path: str, kind: str, parse_fn: Callable[[str], Any]) -> Tuple[Any, bytes]:
+        """Like load_parsed, but also return the SHA-256 digest of the file bytes."""
+        if not self.cache_path:
+            digest, entry = _read_and_parse(path, parse_fn)
+            return _freeze(entry), digest
+        st = os.stat(path)
+        with self._lock:
+            hit = self._lookup_indexed(path, kind, st)
+        if hit is not None:
+            return hit
+        # Reading and parsing happen outside the lock so threads overlap on them
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).digest()
+        with self._lock:
+            key = self._record(path, kind, st, digest)
+            entry = self.entries.get(key)
+        if entry is None:
+            entry = parse_fn(_decode(data))
+            with self._lock:
+                return self._store(key, entry), digest
+        return entry, digest
+
+    def load_parsed_many(self, paths: List[str], kind: str, parse_fn: Callable[[str], Any],
+                         workers: int, chunksize: int = 32) -> List[Tuple[Any, bytes]]:
+        """
+        Like [load_parsed_with_digest(p, kind, parse_fn) for p in paths], but files that
+        are not served from the path index are read and parsed in a pool of worker
+        processes. parse_fn must be picklable (a module-level function or classmethod).
+        The cache itself is only updated here in the calling process.
+        """
+        results: List[Optional[Tuple[Any, bytes]]] = [None] * len(paths)
+        misses = []
+        for i, path in enumerate(paths):
+            st = os.stat(path) if self.cache_path else None
+            with self._lock:
+                results[i] = self._lookup_indexed(path, kind, st) if st else None
+            if results[i] is None:
+                misses.append((i, st))
+        if misses:
+            miss_paths = [paths[i] for i, _ in misses]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(_read_and_parse, miss_paths, [parse_fn] * len(miss_paths), chunksize=chunksize))
+            for (i, st), (digest, entry) in zip(misses, parsed):
+                if st is None:
+                    results[i] = (_freeze(entry), digest)
+                    continue
+                with self._lock:
+                    key = self._record(paths[i], kind, st, digest)
+                    cached = self.entries.get(key)
+                    results[i] = (cached if cached is not None else self._store(key, entry), digest)
+        return results  # type: ignore[return-value]
+
+    def _lookup_indexed(self, path: str, kind: str, st: os.stat_result) -> Optional[Tuple[Any, bytes]]:
+        """Return (entry, digest) if path is untouched since it was indexed, else None."""
+        indexed = self.paths.get(path)
+        if indexed and indexed[0] == st.st_mtime_ns and indexed[1] == st.st_size:
+            key = f"{kind}:{indexed[2][:16]}"
+            entry = self.entries.get(key)
+            if entry is not None:
+                # Untouched since it was indexed: no read, hash or parse needed
+                self._used_keys.add(key)
+                self._used_paths.add(path)
+                return entry, bytes.fromhex(indexed[2])
+        return None
+
+    def _record(self, path: str, kind: str, st: os.stat_result, digest: bytes) -> str:
+        """Mark the entry for digest as used and index path; returns the entry key."""
+        key = f"{kind}:{digest.hex()[:16]}"
+        self._used_keys.add(key)
+        self._index_path(path, st, digest)
+        return key
+
+    def _store(self, key: str, entry: Any) -> Any:
+        """Cache a freshly parsed entry if it survives a JSON round trip; returns the frozen entry."""
+        entry = _freeze(entry)
+        try:
+            round_tripped = _freeze(json.loads(json.dumps(entry)))
+        except (TypeError, ValueError):
+            # Values JSON can't hold (e.g. dates) are parsed every run
+            return entry
+        if round_tripped != entry:
+            # Non-string keys (e.g. `2024: read`) would come back changed after save/load
+            return entry
+        self.entries[key] = entry
+        self._dirty = True
+        return entry
+
+    def _index_path(self, path: str, st: os.stat_result, digest: bytes) -> None:
+        """Record which digest path had at the given stat, unless its mtime is too recent to trust."""
+        if time.time_ns() - st.st_mtime_ns < self.RACY_WINDOW_NS:
+            self.paths.pop(path, None)
+            return
+        self._used_paths.add(path)
+        record = [st.st_mtime_ns, st.st_size, digest.hex()]
+        if self.paths.get(path) != record:
+            self.paths[path] = record
+            self._dirty = True
@@ -9,7 +9,7 @@ from ..models.destination_quote import DestinationQuote
 from ..models.source_file import SourceFile
 from ..models.destination_file import DestinationFile
 from ..models.destination_vault import DestinationVault
-from ..file_utils import get_book_title_from_path, get_vault_name_from_path
+from ..file_utils import get_book_title_from_path, get_vault_name_from_path, get_markdown_files, filter_sync_quote_files
 from quote_vault_manager import VERSION
 
 
@@ -104,6 +104,7 @@ class QuoteSyncService:
     def _sync_edited_quotes_back(self, source_file: SourceFile, dry_run: bool, results: Dict[str, Any]) -> None:
         """Sync any edited destination quotes back to the source file."""
         print(f"Checking for edited quotes to sync back... (found {len(self._destination_quotes)} destination quotes)")
+        book_title = get_book_title_from_path(source_file.path)
         
         for quote in source_file.quotes:
             if not quote or not quote.block_id:
@@ -119,7 +120,7 @@ class QuoteSyncService:
                     print(f"Synced edit back to source for {quote.block_id}")
                     # Save the destination file to persist the edit flag reset
                     if not dry_run:
-                        self._save_destination_quote(dest_quote, get_book_title_from_path(source_file.path))
+                        self._save_destination_quote(dest_quote, book_title)
     
     def _sync_source_to_destination(self, source_file: SourceFile, source_file_path: str, 
                                   dry_run: bool, results: Dict[str, Any]) -> None:
@@ -211,7 +212,6 @@ class QuoteSyncService:
         existing_files = [f for f in self.destination_vault.files if f.path == quote_file_path]
         if existing_files:
             dest_file = existing_files[0]
-            dest_file.frontmatter = dest_quote.frontmatter.copy()
             dest_file.quote = dest_quote
             # Ensure frontmatter is up to date before saving
             dest_file.frontmatter = dest_quote.frontmatter.copy()
@@ -229,12 +229,14 @@ class QuoteSyncService:
                     DestinationFile.delete(old_file.path)
                 self.destination_vault.files.remove(old_file)
             
-            # Create destination file
+            # Create destination file; source_path is the book title save() links to,
+            # the same value a fresh load would read back from the written Source link
             dest_file = DestinationFile(
                 dest_quote.frontmatter,
                 dest_quote,
                 path=quote_file_path,
-                destination_vault=self.destination_vault
+                destination_vault=self.destination_vault,
+                source_path=book_title
             )
             self.destination_vault.files.append(dest_file)
         
@@ -256,18 +258,15 @@ class QuoteSyncService:
         }
         
         # Get all markdown files in source vault
-        from ..file_utils import get_markdown_files, has_sync_quotes_flag
-        
         markdown_files = get_markdown_files(self.source_vault_path)
         
-        for file_path in markdown_files:
-            if has_sync_quotes_flag(file_path):
-                file_results = self.sync_source_file(file_path, dry_run)
-                results['source_files_processed'] += 1
-                results['total_quotes_processed'] += file_results['quotes_processed']
-                results['total_quotes_created'] += file_results['quotes_created']
-                results['total_quotes_updated'] += file_results['quotes_updated']
-                results['total_quotes_synced_back'] += file_results['quotes_synced_back']
-                results['errors'].extend(file_results['errors'])
+        for file_path in filter_sync_quote_files(markdown_files):
+            file_results = self.sync_source_file(file_path, dry_run)
+            results['source_files_processed'] += 1
+            results['total_quotes_processed'] += file_results['quotes_processed']
+            results['total_quotes_created'] += file_results['quotes_created']
+            results['total_quotes_updated'] += file_results['quotes_updated']
+            results['total_quotes_synced_back'] += file_results['quotes_synced_back']
+            results['errors'].extend(file_results['errors'])
         
         return results 
\ No newline at end of file
@@ -47,9 +47,9 @@ def sync_source_file(
     quotes_with_ids = [(q.text, q.block_id) for q in source.quotes]
     block_id_map = {i: q.block_id for i, q in enumerate(source.quotes) if q.block_id}
     
-    # Sync quotes to destination
+    # Sync quotes to destination; the orphan removal below commits both steps at once
     sync_results = temp_dest_vault.sync_quotes_from_source(
-        source_file, quotes_with_ids, block_id_map, dry_run, vault_name, source_vault_path
+        source_file, quotes_with_ids, block_id_map, dry_run, vault_name, source_vault_path, commit=False
     )
     results.update(sync_results)
     
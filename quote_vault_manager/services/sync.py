@@ -4,9 +4,10 @@ Main synchronization orchestrator for the quote vault manager.
 
 from typing import Dict, Any, Optional
 from quote_vault_manager.config import load_config, ConfigError
-from quote_vault_manager.file_utils import has_sync_quotes_flag, get_markdown_files, get_vault_name_from_path
+from quote_vault_manager.file_utils import clear_frontmatter_cache, filter_sync_quote_files, get_markdown_files, get_vault_name_from_path
 from quote_vault_manager.services.transformation_manager import transformation_manager
 from quote_vault_manager.services.quote_sync import QuoteSyncService
+from quote_vault_manager.services.parse_cache import ParseCache
 from quote_vault_manager.models.source_vault import SourceVault
 from quote_vault_manager.models.destination_vault import DestinationVault
 from quote_vault_manager import VERSION
@@ -33,6 +34,9 @@ def sync_vaults(config: Dict[str, str], dry_run: bool = False) -> Dict[str, Any]
     destination_vault_path = config['destination_vault_path']
     source_vault_name = get_vault_name_from_path(source_vault_path)
     destination_vault_name = get_vault_name_from_path(destination_vault_path)
+    parse_cache = ParseCache.get_instance()
+    parse_cache.load(destination_vault_path)
+    clear_frontmatter_cache()
 
     # Step 0: Apply transformations to all quote files before sync
     _apply_transformations(destination_vault_path, dry_run)
@@ -57,12 +61,16 @@ def sync_vaults(config: Dict[str, str], dry_run: bool = False) -> Dict[str, Any]
     results['total_edited_quotes_synced'] = sync_results['total_quotes_synced_back']
     results['errors'].extend(sync_results['errors'])
 
-    # Step 3: Handle delete flags (still using existing logic for now)
+    # Step 3: Handle delete flags on a fresh load of what step 2 wrote; files it left
+    # untouched are served from the parse cache
     destination_vault = DestinationVault(destination_vault_path, destination_vault_name, source_vault)
     delete_results = destination_vault.delete_flagged(source_vault_path, dry_run)
     results['total_quotes_unwrapped'] = delete_results.get('quotes_unwrapped', 0)
     results['errors'].extend(delete_results.get('errors', []))
 
+    if not dry_run:
+        parse_cache.save()
+
     return results
 
 
@@ -80,17 +88,16 @@ def _process_source_files(source_vault_path: str, destination_vault_path: str, d
     """Process all source files with sync_quotes flag and update results."""
     markdown_files = get_markdown_files(source_vault_path)
     
-    for file_path in markdown_files:
-        if has_sync_quotes_flag(file_path):
-            file_results = sync_source_file(file_path, destination_vault_path, dry_run, source_vault_path)
-            
-            results['source_files_processed'] += 1
-            results['total_quotes_processed'] += file_results['quotes_processed']
-            results['total_quotes_created'] += file_results['quotes_created']
-            results['total_quotes_updated'] += file_results['quotes_updated']
-            results['total_block_ids_added'] += file_results['block_ids_added']
-            results['total_quotes_deleted'] += file_results.get('quotes_deleted', 0)
-            results['errors'].extend(file_results['errors'])
+    for file_path in filter_sync_quote_files(markdown_files):
+        file_results = sync_source_file(file_path, destination_vault_path, dry_run, source_vault_path)
+        
+        results['source_files_processed'] += 1
+        results['total_quotes_processed'] += file_results['quotes_processed']
+        results['total_quotes_created'] += file_results['quotes_created']
+        results['total_quotes_updated'] += file_results['quotes_updated']
+        results['total_block_ids_added'] += file_results['block_ids_added']
+        results['total_quotes_deleted'] += file_results.get('quotes_deleted', 0)
+        results['errors'].extend(file_results['errors'])
 
 
 def sync_source_file(source_file: str, destination_vault_path: str, dry_run: bool = False, 
@@ -99,8 +106,6 @@ def sync_source_file(source_file: str, destination_vault_path: str, dry_run: boo
     Legacy function for backward compatibility.
     Now delegates to the new QuoteSyncService.
     """
-    from quote_vault_manager.services.quote_sync import QuoteSyncService
-    
     quote_sync_service = QuoteSyncService(source_vault_path or "", destination_vault_path)
     return quote_sync_service.sync_source_file(source_file, dry_run)
 
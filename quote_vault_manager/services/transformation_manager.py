@@ -3,8 +3,8 @@ Transformation manager for applying versioned transformations to quote files.
 """
 
 import os
-import glob
 from typing import Dict, Any
+from quote_vault_manager.file_utils import iter_markdown_files, VAULT_INTERNAL_DIRS
 from quote_vault_manager.models.destination_file import DestinationFile
 from quote_vault_manager.services.backup_service import BackupService
 from quote_vault_manager import VERSION
@@ -20,7 +20,11 @@ class TransformationManager:
 
     def apply_transformations_to_quote_file(self, file_path: str, dry_run: bool = False) -> bool:
         """Applies all necessary transformations to a quote file and updates it if needed."""
-        dest = DestinationFile.from_file(file_path)
+        return self._apply_transformations(DestinationFile.from_file(file_path), dry_run)
+
+    def _apply_transformations(self, dest: DestinationFile, dry_run: bool = False) -> bool:
+        """Applies all necessary transformations to an already-loaded quote file."""
+        file_path = dest.path
         frontmatter = dest.frontmatter
         content = dest.quote.text
         file_version = frontmatter.get('version', 'V0.0')
@@ -43,23 +47,24 @@ class TransformationManager:
         """Applies transformations to all quote files in the destination vault."""
         if not os.path.exists(destination_vault_path):
             return 0
-        quote_files = glob.glob(os.path.join(destination_vault_path, '**', '*.md'), recursive=True)
-        files_needing_update = 0
-        for file_path in quote_files:
-            dest = DestinationFile.from_file(file_path)
+        # Files are parsed as the walk yields them and only outdated ones are kept,
+        # so up-to-date vaults never hold more than one parsed file at a time
+        outdated = []
+        for entry in iter_markdown_files(destination_vault_path, skip_dirs=VAULT_INTERNAL_DIRS):
+            dest = DestinationFile.from_file(entry.path)
             file_version = dest.frontmatter.get('version', 'V0.0')
             if file_version != self.version:
-                files_needing_update += 1
+                outdated.append(dest)
         # Create backup before destructive changes if any files need updating
-        if files_needing_update > 0 and not dry_run:
+        if outdated and not dry_run:
             backup_path = self.backup_service.create_backup(destination_vault_path, self.version, dry_run=False)
             print(f"📦 Created backup at: {backup_path}")
             removed_backups = self.backup_service.cleanup_old_backups(destination_vault_path, dry_run=False)
             if removed_backups:
                 print(f"🗑️  Removed {len(removed_backups)} old backup(s)")
         files_updated = 0
-        for file_path in quote_files:
-            if self.apply_transformations_to_quote_file(file_path, dry_run=dry_run):
+        for dest in outdated:
+            if self._apply_transformations(dest, dry_run=dry_run):
                 files_updated += 1
         return files_updated
 
@@ -65,6 +65,8 @@ def test_create_backup_actual():
         
         assert os.path.exists(backup_file1)
         assert os.path.exists(backup_file2)
+        with open(backup_file1) as f:
+            assert f.read() == "Quote 1 content"
         
         # Should not copy .backup directory itself
         backup_backup = os.path.join(backup_path, ".backup")
@@ -224,4 +224,13 @@ def test_edit_flag_reset_with_filename_change(tmp_path):
         assert "edited: false" in new_content
         assert "Completely different quote text that will change filename" in new_content
     
-    assert results['quotes_synced_back'] == 1 
\ No newline at end of file
+    assert results['quotes_synced_back'] == 1 
+
+
+def test_is_edited_quote_file_tracks_file_changes(tmp_path):
+    qf = make_quote_file(tmp_path, {'edited': True, 'delete': False}, "A quote")
+    assert DestinationFile.is_edited_quote_file(qf)
+    # Rewriting the file invalidates the cached frontmatter
+    make_quote_file(tmp_path, {'edited': False, 'delete': False}, "A quote, longer")
+    assert not DestinationFile.is_edited_quote_file(qf)
+    assert not DestinationFile.is_edited_quote_file(str(tmp_path / "missing.md"))
@@ -1,4 +1,5 @@
 import os
+import shutil
 import tempfile
 import pytest
 from quote_vault_manager.models.quote import Quote
@@ -41,6 +42,16 @@ def test_source_file_from_file_and_save(tmp_path):
     assert '"Another quote"' in unwrapped_content
     assert "^Quote002" not in unwrapped_content
 
+def test_source_file_unwraps_multiple_quotes_in_one_save(tmp_path):
+    file_path = tmp_path / "source.md"
+    file_path.write_text("> One\n^Quote001\n> Two\n^Quote002\n> Three\n^Quote003\n")
+    source = SourceFile.from_file(str(file_path))
+    source.unwrap_quote(source.quotes[0])
+    source.unwrap_quote(source.quotes[2])
+    source.save()
+    result = file_path.read_text()
+    assert result == '"One"\n> Two\n^Quote002\n"Three"'
+
 def test_source_file_preserves_non_quote_content(tmp_path):
     file_path = tmp_path / "source.md"
     content = """# Header\n\nSome intro text.\n\n> A quote\n^Quote001\n\nSome middle text.\n\n> Another quote\n^Quote002\n\nFooter text."""
@@ -113,4 +124,150 @@ def test_destination_file_from_file_and_save(tmp_path):
     saved_content = file_path.read_text()
     assert "> A quote" in saved_content
     assert "**Source:**" in saved_content
-    assert "[Random Note]" in saved_content 
\ No newline at end of file
+    assert "[Random Note]" in saved_content 
+
+
+def test_destination_file_save_skips_unchanged_content(tmp_path):
+    file_path = tmp_path / "Book - Quote001 - Test.md"
+    file_path.write_text("---\n---\n\n> A quote\n")
+    dest = DestinationFile.from_file(str(file_path))
+    dest.save(str(file_path))
+    os.utime(file_path, ns=(0, 0))
+    # Saving identical content must not touch the file
+    dest.save(str(file_path))
+    assert os.stat(file_path).st_mtime_ns == 0
+    dest.quote.text = "A changed quote"
+    dest.save(str(file_path))
+    assert os.stat(file_path).st_mtime_ns != 0
+    assert "> A changed quote" in file_path.read_text()
+
+def test_destination_file_save_leaves_no_temp_files(tmp_path):
+    file_path = tmp_path / "Book - Quote001 - Test.md"
+    file_path.write_text("---\n---\n\n> A quote\n")
+    dest = DestinationFile.from_file(str(file_path))
+    dest.quote.text = "A changed quote"
+    dest.save(str(file_path))
+    dest.update_frontmatter({'edited': False})
+    assert os.listdir(tmp_path) == [file_path.name]
+    assert "> A changed quote" in file_path.read_text()
+
+def test_destination_file_concurrent_saves_of_one_path(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    file_path = tmp_path / "Book - Quote001 - Test.md"
+    dests = [DestinationFile({}, Quote(f"Quote {i}", "^Quote001"), source_path="Book.md") for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda dest: dest.save(str(file_path)), dests))
+    assert os.listdir(tmp_path) == [file_path.name]
+    umask = os.umask(0)
+    os.umask(umask)
+    assert os.stat(file_path).st_mode & 0o777 == 0o666 & ~umask
+
+def test_destination_file_update_frontmatter_skips_noop_write(tmp_path):
+    file_path = tmp_path / "Book - Quote001 - Test.md"
+    file_path.write_text("---\nedited: false\n---\n\n> A quote\n")
+    dest = DestinationFile.from_file(str(file_path))
+    os.utime(file_path, ns=(0, 0))
+    dest.update_frontmatter({'edited': False})
+    assert os.stat(file_path).st_mtime_ns == 0
+    dest.update_frontmatter({'edited': True})
+    assert os.stat(file_path).st_mtime_ns != 0
+    assert file_path.read_text() == "---\nedited: true\n---\n\n> A quote\n"
+
+def test_destination_file_save_unchanged_skips_write(tmp_path, monkeypatch):
+    file_path = tmp_path / "Book - Quote001 - Test.md"
+    file_path.write_text("---\n---\n\n> A quote\n")
+    dest = DestinationFile.from_file(str(file_path))
+    dest.save(str(file_path))
+    reloaded = DestinationFile.from_file(str(file_path))
+    def fail(*args):
+        raise AssertionError("unchanged content should be detected from the loaded hash")
+    monkeypatch.setattr(DestinationFile, "_write_atomic", staticmethod(fail))
+    reloaded.save(str(file_path))
+
+def test_destination_file_update_frontmatter_preserves_body(tmp_path):
+    file_path = tmp_path / "Book - Quote001 - Test.md"
+    body = "\n> A quote\n\n**Source:** [Book](obsidian://open?vault=Notes&file=Book%23%5EQuote001)\n"
+    file_path.write_text("---\nedited: true\n---\n" + body)
+    dest = DestinationFile.from_file(str(file_path))
+    dest.update_frontmatter({'edited': False})
+    dest.update_frontmatter({'favorite': True})
+    assert file_path.read_text() == "---\nedited: false\nfavorite: true\n---\n" + body
+
+def test_destination_file_update_frontmatter_deferred_until_save(tmp_path):
+    file_path = tmp_path / "Book - Quote001 - Test.md"
+    file_path.write_text("---\nedited: true\n---\n\n> A quote\n")
+    dest = DestinationFile.from_file(str(file_path))
+    dest.update_frontmatter({'edited': False}, flush=False)
+    dest.update_frontmatter({'favorite': True}, flush=False)
+    assert dest.needs_update
+    assert "edited: true" in file_path.read_text()
+    dest.save(str(file_path))
+    assert file_path.read_text().startswith("---\nedited: false\nfavorite: true\n---\n")
+
+def test_destination_file_save_recreates_removed_directory(tmp_path):
+    book_dir = tmp_path / "Book"
+    dest = DestinationFile({}, Quote("A quote", "^Quote001"), source_path="Book.md")
+    dest.save(str(book_dir / "Book - Quote001 - A quote.md"))
+    shutil.rmtree(book_dir)
+    dest.save(str(book_dir / "Book - Quote002 - A quote.md"))
+    assert os.listdir(book_dir) == ["Book - Quote002 - A quote.md"]
+
+def test_frontmatter_str_to_dict_returns_independent_copies():
+    first = DestinationFile.frontmatter_str_to_dict("edited: true\ntags:\n- a\n")
+    first['edited'] = False
+    first['tags'].append('b')
+    second = DestinationFile.frontmatter_str_to_dict("edited: true\ntags:\n- a\n")
+    assert second == {'edited': True, 'tags': ['a']}
+    assert DestinationFile.frontmatter_str_to_dict("key: [unclosed") == {}
+
+def test_frontmatter_fast_path_matches_yaml():
+    import yaml
+    for frontmatter in [
+        'delete: false\nfavorite: false\nedited: false\nversion: "V0.3"',
+        'edited: true\nversion: V0.3',
+        'version: 0.3',
+        'flag: yes',
+        'tags:\n- a\n- b',
+    ]:
+        assert DestinationFile.frontmatter_str_to_dict(frontmatter) == yaml.safe_load(frontmatter)
+    for frontmatter_dict in [
+        {'delete': False, 'favorite': True, 'edited': False, 'version': 'V0.3'},
+        {'version': '0.3'},
+        {'version': 'yes'},
+        {'tags': ['a', 'b']},
+    ]:
+        expected = yaml.safe_dump(frontmatter_dict, sort_keys=False).strip()
+        assert DestinationFile.frontmatter_dict_to_str(frontmatter_dict) == expected
+
+def test_source_file_get_quote_tracks_changes():
+    source = SourceFile("Book.md", [Quote("First", "^Quote001"), Quote("Duplicate", "^Quote001")])
+    assert source.get_quote("^Quote001").text == "First"
+    assert source.get_quote("^Quote002") is None
+    source.add_quote("Second", "^Quote002")
+    assert source.get_quote("^Quote002").text == "Second"
+    source.quotes[0].block_id = "^Quote003"
+    assert source.get_quote("^Quote003").text == "First"
+    assert source.get_quote("^Quote001").text == "Duplicate"
+
+def test_source_file_save_writes_block_ids_once(tmp_path, monkeypatch):
+    file_path = tmp_path / "Book.md"
+    file_path.write_text("> First\n\n> Second\n^Quote001\n\n> Third\n")
+    source = SourceFile.from_file(str(file_path))
+    assert source.assign_missing_block_ids() == 2
+    writes = []
+    original = SourceFile._write_lines
+    monkeypatch.setattr(SourceFile, "_write_lines", lambda self, lines: (writes.append(1), original(self, lines)))
+    source.save()
+    assert len(writes) == 1
+    assert file_path.read_text() == "> First\n^Quote002\n\n> Second\n^Quote001\n\n> Third\n^Quote003"
+
+def test_source_file_validates_and_assigns_without_rereading(tmp_path, monkeypatch):
+    file_path = tmp_path / "Book.md"
+    file_path.write_text("> First\n^Quote002\n\n> Second\n^Quote2\n\n> Third\n")
+    source = SourceFile.from_file(str(file_path))
+    def fail(self):
+        raise AssertionError("from_file should have kept what validation and assignment need")
+    monkeypatch.setattr(SourceFile, "_read_content", fail)
+    assert source.validate_block_ids() == SourceFile.validate_block_ids_from_content(file_path.read_text())
+    assert source.assign_missing_block_ids() == 2
+    assert [q.block_id for q in source.quotes] == ["^Quote002", "^Quote003", "^Quote004"]
@@ -0,0 +1,186 @@
+"""
+Tests for the content-hash parse cache.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from quote_vault_manager.services.parse_cache import ParseCache
+from quote_vault_manager.models.source_file import SourceFile
+from quote_vault_manager.models.destination_file import DestinationFile
+
+
+def test_load_parsed_skips_parse_for_unchanged_content(tmp_path):
+    cache = ParseCache()
+    cache.load(str(tmp_path))
+    file_path = tmp_path / "a.md"
+    file_path.write_text("> Quote 1\n^Quote001\n")
+    calls = []
+
+    def parse(content):
+        calls.append(content)
+        return [content]
+
+    # Lists come back frozen, so one entry can be shared by every caller
+    assert cache.load_parsed(str(file_path), 'test', parse) == ("> Quote 1\n^Quote001\n",)
+    assert cache.load_parsed(str(file_path), 'test', parse) == ("> Quote 1\n^Quote001\n",)
+    assert len(calls) == 1
+
+    # Changing the file invalidates the entry
+    file_path.write_text("> Quote 2\n^Quote001\n")
+    assert cache.load_parsed(str(file_path), 'test', parse) == ("> Quote 2\n^Quote001\n",)
+    assert len(calls) == 2
+
+
+def test_cache_is_inactive_until_loaded(tmp_path):
+    cache = ParseCache()
+    file_path = tmp_path / "a.md"
+    file_path.write_text("> Quote 1\n^Quote001\n")
+    calls = []
+
+    def parse(content):
+        calls.append(content)
+        return content
+
+    cache.load_parsed(str(file_path), 'test', parse)
+    cache.load_parsed(str(file_path), 'test', parse)
+    assert len(calls) == 2
+    assert cache.entries == {} and cache.paths == {}
+
+
+def test_cache_persists_between_runs_and_clears(tmp_path):
+    vault = tmp_path / "quotes"
+    vault.mkdir()
+    file_path = vault / "a.md"
+    file_path.write_text("> Quote 1\n^Quote001\n")
+
+    cache = ParseCache()
+    cache.load(str(vault))
+    cache.load_parsed(str(file_path), 'test', lambda content: {'text': content})
+    cache.save()
+    cache_file = os.path.join(cache.get_cache_dir(str(vault)), ParseCache.CACHE_FILE)
+    assert os.path.exists(cache_file)
+
+    reloaded = ParseCache()
+    reloaded.load(str(vault))
+    assert len(reloaded.entries) == 1
+
+    reloaded.clear(str(vault))
+    assert not os.path.exists(cache_file)
+    assert reloaded.entries == {}
+
+
+def test_cached_models_are_independent(tmp_path):
+    source_path = tmp_path / "Book.md"
+    source_path.write_text("---\nsync_quotes: true\n---\n\n> Quote 1\n^Quote001\n")
+    first = SourceFile.from_file(str(source_path))
+    first.quotes[0].text = "Changed"
+    second = SourceFile.from_file(str(source_path))
+    assert second.quotes[0].text == "Quote 1"
+
+    dest_path = tmp_path / "Book - Quote001 - Quote 1.md"
+    dest_path.write_text("---\ndelete: false\n---\n\n> Quote 1\n")
+    dest = DestinationFile.from_file(str(dest_path))
+    dest.frontmatter['delete'] = True
+    assert DestinationFile.from_file(str(dest_path)).frontmatter == {'delete': False}
+
+
+def test_path_index_serves_untouched_files_without_reading(tmp_path):
+    vault = tmp_path / "quotes"
+    vault.mkdir()
+    file_path = vault / "a.md"
+    file_path.write_text("> Quote 1\n^Quote001\n")
+    os.utime(file_path, ns=(10**18, 10**18))
+
+    cache = ParseCache()
+    cache.load(str(vault))
+    cache.load_parsed(str(file_path), 'test', lambda content: {'text': content})
+    cache.save()
+
+    # Same size and mtime: the index is trusted and the file is not re-read
+    file_path.write_text("> Quote 2\n^Quote001\n")
+    os.utime(file_path, ns=(10**18, 10**18))
+    reloaded = ParseCache()
+    reloaded.load(str(vault))
+    assert reloaded.load_parsed(str(file_path), 'test', lambda content: {'text': content}) == {'text': "> Quote 1\n^Quote001\n"}
+
+    # A new mtime invalidates the index entry
+    os.utime(file_path, ns=(15 * 10**17, 15 * 10**17))
+    assert reloaded.load_parsed(str(file_path), 'test', lambda content: {'text': content}) == {'text': "> Quote 2\n^Quote001\n"}
+
+
+def test_path_index_skips_recently_modified_files(tmp_path):
+    cache = ParseCache()
+    file_path = tmp_path / "a.md"
+    file_path.write_text("> Quote 1\n^Quote001\n")
+    cache.load_parsed(str(file_path), 'test', lambda content: content)
+    assert str(file_path) not in cache.paths
+
+
+def test_load_parsed_many_matches_single_loads(tmp_path):
+    paths = []
+    for i in range(3):
+        file_path = tmp_path / f"{i}.md"
+        file_path.write_bytes(f"> Quote {i}\r\n^Quote00{i}\n".encode())
+        paths.append(str(file_path))
+    expected = [ParseCache().load_parsed_with_digest(p, 'test', str.upper) for p in paths]
+    cache = ParseCache()
+    cache.load(str(tmp_path))
+    assert cache.load_parsed_many(paths, 'test', str.upper, workers=2) == expected
+    assert len(cache.entries) == 3
+
+
+def test_load_parsed_from_many_threads(tmp_path):
+    paths = []
+    for i in range(64):
+        file_path = tmp_path / f"{i}.md"
+        file_path.write_text(f"> Quote {i}\n^Quote{i:03d}\n")
+        os.utime(file_path, ns=(10**18, 10**18))
+        paths.append(str(file_path))
+    cache = ParseCache()
+    cache.load(str(tmp_path))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda p: cache.load_parsed(p, 'test', str.upper), paths * 4))
+    assert results == [open(p).read().upper() for p in paths] * 4
+    assert len(cache.entries) == len(cache.paths) == len(cache._used_keys) == 64
+
+def test_forget_drops_deleted_path_from_index(tmp_path):
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    file_path = vault / "a.md"
+    file_path.write_text("> Quote 1\n^Quote001\n")
+    os.utime(file_path, ns=(10**18, 10**18))
+    cache = ParseCache()
+    cache.load(str(vault))
+    cache.load_parsed(str(file_path), 'test', lambda content: content)
+    cache.forget(str(file_path))
+    cache.save()
+    reloaded = ParseCache()
+    reloaded.load(str(vault))
+    assert reloaded.paths == {}
+
+
+def test_entries_that_change_in_json_are_not_cached(tmp_path):
+    vault = tmp_path / "quotes"
+    vault.mkdir()
+    file_path = vault / "a.md"
+    file_path.write_text("2024: read\n")
+
+    cache = ParseCache()
+    cache.load(str(vault))
+    # JSON would load the key back as '2024'
+    assert cache.load_parsed(str(file_path), 'test', lambda content: {2024: 'read'}) == {2024: 'read'}
+    assert cache.entries == {}
+
+
+def test_destination_frontmatter_survives_cache_round_trip(tmp_path, monkeypatch):
+    vault = tmp_path / "quotes"
+    vault.mkdir()
+    dest_path = vault / "Book - Quote001 - Quote 1.md"
+    dest_path.write_text("---\n2024: read\n---\n\n> Quote 1\n")
+    os.utime(dest_path, ns=(10**18, 10**18))
+    for _ in range(2):
+        cache = ParseCache()
+        monkeypatch.setattr(ParseCache, "_instance", cache)
+        cache.load(str(vault))
+        assert DestinationFile.from_file(str(dest_path)).frontmatter == {2024: 'read'}
+        cache.save()
@@ -71,6 +71,15 @@ def test_get_next_block_id():
     result3 = SourceFile.get_next_block_id(sample3)
     assert result3 == "^Quote1000", f"Expected ^Quote1000, got {result3}"
     
+    # Test CRLF line endings and the other breaks splitlines() recognises
+    sample4 = "> First quote\r\n^Quote001\r\n> Second quote\r\n  ^Quote002 \r\n"
+    result4 = SourceFile.get_next_block_id(sample4)
+    assert result4 == "^Quote003", f"Expected ^Quote003, got {result4}"
+    for sep in ["\r", "\x0b", "\x0c", "\x85", "\u2028", "\u2029"]:
+        sample5 = f"> A quote{sep}^Quote004{sep}> Text ^Quote009{sep}"
+        result5 = SourceFile.get_next_block_id(sample5)
+        assert result5 == "^Quote005", f"Expected ^Quote005 for {sep!r}, got {result5}"
+    
     print("Next block ID tests passed.")
 
 if __name__ == "__main__":
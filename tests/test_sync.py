@@ -1,11 +1,13 @@
 import tempfile
 import os
+import time
 import logging
 from quote_vault_manager.services.logger import Logger
 from quote_vault_manager.services.sync import sync_vaults
 from quote_vault_manager.file_utils import (
     has_sync_quotes_flag,
     get_markdown_files,
+    iter_markdown_files,
     get_book_title_from_path
 )
 from quote_vault_manager.services.source_sync import sync_source_file
@@ -39,6 +41,29 @@ def test_setup_logging_and_log_sync_action_and_log_error():
 
         print("Logger setup and logging tests passed.")
 
+def test_logger_setup_is_idempotent(tmp_path):
+    import threading
+    logger = Logger(str(tmp_path / "std.log"), str(tmp_path / "err.log"), background=True)
+    threads = threading.active_count()
+    logger.setup()
+    logger.setup()
+    assert threading.active_count() == threads
+    assert len(logger._listeners) == 2
+    logger.log_error("After re-setup")
+    logger.close()
+    assert threading.active_count() == threads - 2
+    assert "After re-setup" in (tmp_path / "err.log").read_text()
+
+def test_logger_flush_keeps_listeners_running(tmp_path):
+    logger = Logger(str(tmp_path / "std.log"), str(tmp_path / "err.log"), background=True)
+    listeners = list(logger._listeners)
+    logger.log_sync_action("ACTION", "Queued details")
+    logger.flush()
+    assert "ACTION: Queued details" in (tmp_path / "std.log").read_text()
+    assert logger._listeners == listeners
+    assert all(listener._thread is not None for listener in listeners)
+    logger.close()
+
 def test_has_sync_quotes_flag():
     with tempfile.TemporaryDirectory() as temp_dir:
         # Create file with sync_quotes: true
@@ -74,9 +99,58 @@ sync_quotes: false
             f.write(content3)
         
         assert not has_sync_quotes_flag(file3)
+
+def test_has_sync_quotes_flag_long_frontmatter():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Flag sits past the bytes read for the fast head probe
+        file_path = os.path.join(temp_dir, "long.md")
+        with open(file_path, 'w') as f:
+            f.write("---\nsummary: \"" + "x" * 5000 + "\"\nsync_quotes: true\n---\n\n> Some quote\n")
+        assert has_sync_quotes_flag(file_path)
+        
+        # Flag in the body, not the frontmatter
+        body_path = os.path.join(temp_dir, "body.md")
+        with open(body_path, 'w') as f:
+            f.write("---\ntitle: x\n---\n\nsync_quotes: true\n")
+        assert not has_sync_quotes_flag(body_path)
+        assert not has_sync_quotes_flag(os.path.join(temp_dir, "missing.md"))
+
+def test_filter_sync_quote_files():
+    from quote_vault_manager import file_utils
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = []
+        for i, flag in enumerate(["true", "false", "true"]):
+            path = os.path.join(temp_dir, f"test{i}.md")
+            with open(path, 'w') as f:
+                f.write(f"---\nsync_quotes: {flag}\n---\n\n> Some quote\n")
+            paths.append(path)
+        
+        expected = [paths[0], paths[2]]
+        assert file_utils.filter_sync_quote_files(paths) == expected
         
         print("Sync quotes flag detection tests passed.")
 
+def test_frontmatter_cache_skips_recent_files_and_is_bounded(tmp_path, monkeypatch):
+    from quote_vault_manager import file_utils
+    file_utils.clear_frontmatter_cache()
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"note{i}.md"
+        path.write_text("---\nsync_quotes: true\n---\n")
+        paths.append(str(path))
+    # Just written, so the same mtime tick could still hide a rewrite
+    assert file_utils.has_sync_quotes_flag(paths[0])
+    assert paths[0] not in file_utils._FRONTMATTER_CACHE
+
+    old = time.time() - 10
+    for path in paths:
+        os.utime(path, (old, old))
+    monkeypatch.setattr(file_utils, "FRONTMATTER_CACHE_SIZE", 2)
+    assert file_utils.filter_sync_quote_files(paths) == paths
+    assert list(file_utils._FRONTMATTER_CACHE) == paths[1:]
+    file_utils.clear_frontmatter_cache()
+    assert file_utils._FRONTMATTER_CACHE == {}
+
 def test_get_markdown_files():
     with tempfile.TemporaryDirectory() as temp_dir:
         # Create some test files
@@ -99,6 +173,44 @@ def test_get_markdown_files():
         
         print("Markdown file discovery tests passed.")
 
+def test_get_markdown_files_parallel_matches_serial(monkeypatch):
+    from quote_vault_manager import file_utils
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for rel in ["a.md", "b.txt", "x/c.md", "x/y/d.md", "z/e.md",
+                    ".obsidian/f.md", "x/.trash/g.md", "node_modules/h.md"]:
+            path = os.path.join(temp_dir, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write("test content")
+        
+        serial = get_markdown_files(temp_dir)
+        assert len(serial) == 4
+        assert file_utils.get_markdown_files_parallel(temp_dir, threads=4) == serial
+        monkeypatch.setattr(file_utils, "PARALLEL_WALK_THRESHOLD", 0)
+        assert get_markdown_files(temp_dir) == serial
+        assert file_utils.get_markdown_files_parallel(os.path.join(temp_dir, "missing")) == []
+
+def test_iter_markdown_files_skips_dirs():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.makedirs(os.path.join(temp_dir, "subdir"), exist_ok=True)
+        os.makedirs(os.path.join(temp_dir, "archive", "v0_1_2024_01_01"), exist_ok=True)
+        os.makedirs(os.path.join(temp_dir, ".backup", "v0_1_2024_01_01"), exist_ok=True)
+        
+        file1 = os.path.join(temp_dir, "test1.md")
+        file2 = os.path.join(temp_dir, "subdir", "test2.md")
+        file3 = os.path.join(temp_dir, "archive", "v0_1_2024_01_01", "test1.md")
+        file4 = os.path.join(temp_dir, ".backup", "v0_1_2024_01_01", "test1.md")
+        
+        for file_path in [file1, file2, file3, file4]:
+            with open(file_path, 'w') as f:
+                f.write("test content")
+        
+        paths = sorted(entry.path for entry in iter_markdown_files(temp_dir, skip_dirs={'archive'}))
+        assert paths == sorted([file1, file2])
+        # Hidden directories are never walked
+        assert sorted(entry.path for entry in iter_markdown_files(temp_dir)) == sorted([file1, file2, file3])
+        assert list(iter_markdown_files(os.path.join(temp_dir, "missing"))) == []
+
 def test_get_book_title_from_path():
     assert get_book_title_from_path("/path/to/Deep Work.md") == "Deep Work"
     assert get_book_title_from_path("test.md") == "test"
@@ -488,6 +600,91 @@ favorite: false
     assert '^Quote001' not in src_text
     assert results['total_quotes_unwrapped'] == 1
 
+def test_sync_vaults_delete_flagged_moved_source(tmp_path):
+    from quote_vault_manager.services.sync import sync_vaults
+    # Source file lives in a subfolder, but the quote link only has its name
+    source_vault = tmp_path / "source"
+    (source_vault / "Books").mkdir(parents=True)
+    source_file = source_vault / "Books" / "book.md"
+    source_file.write_text("> A quote to delete\n^Quote001\n")
+    dest_vault = tmp_path / "dest"
+    quote_dir = dest_vault / "book"
+    quote_dir.mkdir(parents=True)
+    quote_file = quote_dir / "book - Quote001 - A quote to delete.md"
+    quote_file.write_text("""---
+delete: true
+favorite: false
+---
+
+> A quote to delete
+
+**Source:** [book](obsidian://open?vault=Notes&file=book%23%5EQuote001)
+""")
+    config = {'source_vault_path': str(source_vault), 'destination_vault_path': str(dest_vault)}
+    results = sync_vaults(config, dry_run=False)
+    # The link no longer resolves, so nothing is guessed by filename
+    assert any("Could not find source file book" in error for error in results['errors'])
+    assert results['total_quotes_unwrapped'] == 0
+    assert '^Quote001' in source_file.read_text()
+    assert quote_file.exists()
+
+def test_sync_vaults_delete_flagged_changed_source_text(tmp_path):
+    from quote_vault_manager.services.sync import sync_vaults
+    # The quote text changed in the source, so step 2 renames the flagged quote file
+    source_vault = tmp_path / "source"
+    source_vault.mkdir()
+    source_file = source_vault / "book.md"
+    source_file.write_text("---\nsync_quotes: true\n---\n\n> A changed quote\n^Quote001\n")
+    dest_vault = tmp_path / "dest"
+    quote_dir = dest_vault / "book"
+    quote_dir.mkdir(parents=True)
+    quote_file = quote_dir / "book - Quote001 - A quote to delete.md"
+    quote_file.write_text("""---
+delete: true
+favorite: false
+---
+
+> A quote to delete
+
+**Source:** [book](obsidian://open?vault=Notes&file=book%23%5EQuote001)
+""")
+    config = {'source_vault_path': str(source_vault), 'destination_vault_path': str(dest_vault)}
+    results = sync_vaults(config, dry_run=False)
+    assert not results['errors']
+    assert results['total_quotes_unwrapped'] == 1
+    src_text = source_file.read_text()
+    assert '"A changed quote"' in src_text
+    assert '^Quote001' not in src_text
+    assert not quote_file.exists()
+    assert not (quote_dir / "book - Quote001 - A changed quote.md").exists()
+
+def test_sync_vaults_delete_flagged_title_with_space_and_percent(tmp_path):
+    from quote_vault_manager.services.sync import sync_vaults
+    # The link encodes ' ' and '%' as %20 and %25 before the %23 block anchor
+    source_vault = tmp_path / "source"
+    source_vault.mkdir()
+    source_file = source_vault / "My 100% Book.md"
+    source_file.write_text("---\nsync_quotes: true\n---\n\n> A quote to delete\n^Quote001\n")
+    dest_vault = tmp_path / "dest"
+    quote_dir = dest_vault / "My 100% Book"
+    quote_dir.mkdir(parents=True)
+    quote_file = quote_dir / "My 100% Book - Quote001 - A quote to delete.md"
+    quote_file.write_text("""---
+delete: true
+favorite: false
+---
+
+> A quote to delete
+
+**Source:** [My 100% Book](obsidian://open?vault=Notes&file=My%20100%25%20Book%23%5EQuote001)
+""")
+    config = {'source_vault_path': str(source_vault), 'destination_vault_path': str(dest_vault)}
+    results = sync_vaults(config, dry_run=False)
+    assert not results['errors']
+    assert results['total_quotes_unwrapped'] == 1
+    assert '"A quote to delete"' in source_file.read_text()
+    assert not quote_file.exists()
+
 def test_extract_book_title_from_filename_multiword():
     from quote_vault_manager.models.destination_file import DestinationFile
     filename = "Who Not How - Quote016 - Example quote.md"
@@ -506,6 +703,7 @@ if __name__ == "__main__":
     test_setup_logging_and_log_sync_action_and_log_error()
     test_has_sync_quotes_flag()
     test_get_markdown_files()
+    test_iter_markdown_files_skips_dirs()
     test_get_book_title_from_path()
     test_sync_source_file()
     test_sync_vaults()
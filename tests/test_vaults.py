@@ -5,6 +5,7 @@ from quote_vault_manager.models.source_vault import SourceVault
 from quote_vault_manager.models.destination_vault import DestinationVault
 from quote_vault_manager.models.source_file import SourceFile
 from quote_vault_manager.models.destination_file import DestinationFile
+from quote_vault_manager.models.quote import Quote
 
 
 def test_source_vault_load_and_save(tmp_path):
@@ -31,4 +32,134 @@ def test_destination_vault_load_and_save(tmp_path):
     # Test batch save (should not change content)
     vault.save_all()
     assert file1.read_text() == "---\n---\n\n> Quote 1\n"
-    assert file2.read_text() == "---\n---\n\n> Quote 2\n" 
\ No newline at end of file
+    assert file2.read_text() == "---\n---\n\n> Quote 2\n" 
+
+def test_destination_vault_commit_changes_parallel_save(tmp_path, monkeypatch):
+    monkeypatch.setattr(DestinationVault, "PARALLEL_IO_THRESHOLD", 0)
+    vault = DestinationVault(str(tmp_path))
+    for i in range(1, 21):
+        path = tmp_path / "Book" / f"Book - Quote{i:03d} - Text.md"
+        vault.files.append(DestinationFile.new({'edited': False}, Quote(f"Quote {i}", f"^Quote{i:03d}"), path=str(path)))
+    vault.commit_changes()
+    for i in range(1, 21):
+        content = (tmp_path / "Book" / f"Book - Quote{i:03d} - Text.md").read_text()
+        assert f"> Quote {i}\n" in content
+    assert not any(dest.is_new for dest in vault.files)
+
+def test_destination_vault_known_dirs_last_one_save_pass(tmp_path, monkeypatch):
+    import shutil
+    calls = []
+    real_makedirs = os.makedirs
+    monkeypatch.setattr(os, "makedirs", lambda path, exist_ok=False: calls.append(path) or real_makedirs(path, exist_ok=exist_ok))
+    vault = DestinationVault(str(tmp_path))
+    for i in (1, 2):
+        path = tmp_path / "Book" / f"Book - Quote00{i} - Text.md"
+        vault.files.append(DestinationFile.new({}, Quote(f"Quote {i}", f"^Quote00{i}"), path=str(path), destination_vault=vault))
+    vault.commit_changes()
+    assert calls == [str(tmp_path / "Book")]
+    assert vault._known_dirs is None
+
+    # The folder is gone before the next pass, which creates it again
+    shutil.rmtree(tmp_path / "Book")
+    vault.files[0].quote.text = "Quote 1, edited"
+    vault.files[0].needs_update = True
+    vault.commit_changes()
+    assert "> Quote 1, edited\n" in (tmp_path / "Book" / "Book - Quote001 - Text.md").read_text()
+
+def test_destination_vault_parallel_load_keeps_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(DestinationVault, "PARALLEL_IO_THRESHOLD", 0)
+    for i in range(1, 31):
+        path = tmp_path / f"Book{i % 3}" / f"Book{i % 3} - Quote{i:03d} - Text.md"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(f"---\nedited: false\n---\n\n> Quote {i}\n")
+    expected = [os.path.join(root, name) for root, _, names in os.walk(tmp_path) for name in names]
+    vault = DestinationVault(str(tmp_path))
+    assert [dest.path for dest in vault.files] == expected
+    assert all(dest.destination_vault is vault for dest in vault.files)
+
+def test_destination_vault_process_pool_load_matches_serial(tmp_path, monkeypatch):
+    monkeypatch.setattr(DestinationVault, "PROCESS_POOL_THRESHOLD", 0)
+    for i in range(1, 6):
+        path = tmp_path / "Book" / f"Book - Quote{i:03d} - Text.md"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(f"---\nedited: false\n---\n\n> Quote {i}\n\n**Source:** [Book](obsidian://open?vault=Notes&file=Book%23%5EQuote{i:03d})\n")
+    serial = DestinationVault(str(tmp_path)).files
+    pooled = DestinationVault(str(tmp_path), workers=2)
+    assert [(d.path, d.frontmatter, d.quote, d.source_path) for d in pooled.files] == \
+        [(d.path, d.frontmatter, d.quote, d.source_path) for d in serial]
+    assert all(dest.destination_vault is pooled for dest in pooled.files)
+
+def test_vault_loads_files_on_first_access(tmp_path, monkeypatch):
+    (tmp_path / "a - Quote001 - Test.md").write_text("---\n---\n\n> Quote 1\n")
+    calls = []
+    original = DestinationVault._load_files
+    monkeypatch.setattr(DestinationVault, "_load_files", lambda self: calls.append(1) or original(self))
+    vault = DestinationVault(str(tmp_path))
+    assert calls == []
+    assert len(vault.files) == 1
+    assert len(vault.files) == 1
+    assert calls == [1]
+
+def test_remove_orphaned_quotes_only_touches_own_source(tmp_path):
+    for book in ("Book A", "Book B"):
+        (tmp_path / book).mkdir()
+        for n in (1, 2):
+            (tmp_path / book / f"{book} - Quote00{n} - Text.md").write_text(f"---\n---\n\n> Quote {n}\n")
+    vault = DestinationVault(str(tmp_path))
+    results = vault.remove_orphaned_quotes_for_source("/notes/Book A.md", {0: "^Quote001"}, dry_run=True)
+    assert results['quotes_deleted'] == 1
+    marked = [os.path.basename(dest.path) for dest in vault.files if dest.marked_for_deletion]
+    assert marked == ["Book A - Quote002 - Text.md"]
+
+def test_remove_orphaned_quotes_follows_source_link(tmp_path):
+    def write(folder, name, book, text):
+        (tmp_path / folder).mkdir(exist_ok=True)
+        link = f"obsidian://open?vault=Notes&file={book.replace(' ', '%20')}%23%5E{name}"
+        (tmp_path / folder / f"{book} - {name} - {text}.md").write_text(f"---\n---\n\n> {text}\n\n**Source:** [{book}]({link})\n")
+    write("Book A", "Quote001", "Book A", "Kept")
+    # Moved out of its book folder, but still linked to Book A
+    write("Archive", "Quote002", "Book A", "Moved")
+    # Same block ID as the orphan, but it belongs to Book B
+    write("Book B", "Quote002", "Book B", "Other")
+    vault = DestinationVault(str(tmp_path))
+    results = vault.remove_orphaned_quotes_for_source("/notes/Book A.md", {0: "^Quote001"}, dry_run=True)
+    assert results['quotes_deleted'] == 1
+    marked = [os.path.basename(dest.path) for dest in vault.files if dest.marked_for_deletion]
+    assert marked == ["Book A - Quote002 - Moved.md"]
+
+def test_commit_changes_drops_deleted_files(tmp_path):
+    for n in (1, 2):
+        (tmp_path / "Book").mkdir(exist_ok=True)
+        (tmp_path / "Book" / f"Book - Quote00{n} - Quote {n}.md").write_text(f"---\n---\n\n> Quote {n}\n")
+    vault = DestinationVault(str(tmp_path))
+    files = vault.files
+    vault.remove_orphaned_quotes_for_source("/notes/Book.md", {0: "^Quote001"})
+    assert [dest.quote.block_id for dest in files] == ["^Quote001"]
+    # The quote coming back is a new file, not an update of the deleted one
+    results = vault.sync_quotes_from_source("/notes/Book.md", [("Quote 2", "^Quote002")], {0: "^Quote002"})
+    assert results['quotes_created'] == 1
+    assert (tmp_path / "Book" / "Book - Quote002 - Quote 2.md").exists()
+
+def test_sync_source_file_commits_once(tmp_path, monkeypatch):
+    from quote_vault_manager.services.source_sync import sync_source_file
+    source = tmp_path / "notes" / "Book.md"
+    source.parent.mkdir()
+    source.write_text("---\nsync_quotes: true\n---\n\n> Quote 1\n^Quote001\n")
+    vault = DestinationVault(str(tmp_path / "quotes"))
+    commits = []
+    original = DestinationVault.commit_changes
+    monkeypatch.setattr(DestinationVault, "commit_changes", lambda self, dry_run=False: (commits.append(dry_run), original(self, dry_run)))
+    results = sync_source_file(str(source), vault, source_vault_path=str(source.parent))
+    assert results['quotes_created'] == 1
+    assert commits == [False]
+    assert os.listdir(tmp_path / "quotes" / "Book") == ["Book - Quote001 - Quote 1.md"]
+
+def test_destination_vault_skips_backups(tmp_path):
+    quote_file = tmp_path / "Book" / "Book - Quote001 - Test.md"
+    backup_file = tmp_path / ".backup" / "v0_3_2024_01_01" / "Book" / "Book - Quote001 - Test.md"
+    quote_file.parent.mkdir(parents=True)
+    backup_file.parent.mkdir(parents=True)
+    quote_file.write_text("---\n---\n\n> Quote 1\n")
+    backup_file.write_text("---\n---\n\n> Quote 1\n")
+    vault = DestinationVault(str(tmp_path))
+    assert [f.path for f in vault.files] == [str(quote_file)]